@@ -9,21 +9,32 @@ experience, or without one for entity-only features.
   python demo.py
 """
 
-import os
-from datetime import timedelta
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 import edinet_tools
+from edinet_tools.config import getenv
 
 
 def _get_recent_docs(max_days_back=5):
     """Get documents from today (JST) or the most recent filing day."""
     today = edinet_tools.today_jst()
-    for i in range(max_days_back):
-        d = today - timedelta(days=i)
-        docs = edinet_tools.documents(d.isoformat())
-        if docs:
-            if i > 0:
-                print(f"  (No filings yet for {today} JST — showing {d})")
-            return docs, d
+    # EDINET doesn't publish on weekends, so only ask for weekdays
+    days = [today - timedelta(days=i) for i in range(max_days_back)]
+    days = [d for d in days if d.weekday() < 5]
+    if not days:
+        return [], today
+
+    date_strs = [d.isoformat() for d in days]
+
+    # Fetch all candidate days at once; the listing calls are network-bound
+    with ThreadPoolExecutor(max_workers=len(days)) as pool:
+        results = pool.map(edinet_tools.documents, date_strs)
+        for d, docs in zip(days, results):
+            if docs:
+                if d != today:
+                    print(f"  (No filings yet for {today} JST — showing {d})")
+                return docs, d
     return [], today
 
 
@@ -54,6 +65,11 @@ def entity_lookup():
 
 # ── 2. Document listing ───────────────────────────────────────────
 
+def _submit_time(doc):
+    """Sort key: when the document was filed (undated filings sort last)."""
+    return doc.filing_datetime or datetime.min
+
+
 def list_documents():
     """Fetch the latest day's filings and show a summary."""
     print("\n--- Recent Documents ---")
@@ -61,7 +77,8 @@ def list_documents():
     docs, filing_date = _get_recent_docs()
     print(f"Found {len(docs)} filings from {filing_date}")
 
-    for doc in docs[:5]:
+    # Only the newest few are shown, so pick them without sorting every filing
+    for doc in heapq.nlargest(5, docs, key=_submit_time):
         print(f"  {doc.doc_id}: {doc.filer_name[:40]} — {doc.doc_type_name}")
 
     return docs
@@ -69,96 +86,111 @@ def list_documents():
 
 # ── 3. Typed parsers ─────────────────────────────────────────────
 
-def parse_large_holding(docs):
-    """Parse a large holding report (doc 350) — typed fields."""
+def _parse_first_of_each(docs, code_groups):
+    """Parse the first doc matching each group of type codes, concurrently.
+
+    Each parse() downloads a filing, so the round-trips are issued together
+    rather than one section at a time. Returns {codes: report}.
+    """
+    picks = {}
+    for codes in code_groups:
+        doc = next((d for d in docs if d.doc_type_code in codes), None)
+        if doc is not None:
+            picks[codes] = doc
+    if not picks:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(picks)) as pool:
+        futures = {codes: pool.submit(doc.parse) for codes, doc in picks.items()}
+    return {codes: future.result() for codes, future in futures.items()}
+
+
+def parse_large_holding(report):
+    """Show a parsed large holding report (doc 350) — typed fields."""
     print("\n--- Large Holding Report (Doc 350) ---")
 
-    for doc in docs:
-        if doc.doc_type_code == "350":
-            report = doc.parse()  # → LargeHoldingReport
-            print(f"  Parser:    {type(report).__name__}")
-            print(f"  Filer:     {report.filer_name}")
-            print(f"  Target:    {report.target_company}")
-            if report.ownership_pct is not None:
-                print(f"  Ownership: {report.ownership_pct}%")
-            if report.prior_ownership_pct is not None:
-                print(f"  Prior:     {report.prior_ownership_pct}%")
-            if report.purpose:
-                preview = report.purpose[:120].replace('\n', ' ')
-                print(f"  Purpose:   {preview}...")
-            return
-
-    print("  No doc 350 found in the last 5 days")
-
-
-def parse_treasury_stock(docs):
-    """Parse a treasury stock report (doc 220) — typed fields."""
+    if report is None:
+        print("  No doc 350 found in the last 5 days")
+        return
+
+    # report: LargeHoldingReport
+    print(f"  Parser:    {type(report).__name__}")
+    print(f"  Filer:     {report.filer_name}")
+    print(f"  Target:    {report.target_company}")
+    if report.ownership_pct is not None:
+        print(f"  Ownership: {report.ownership_pct}%")
+    if report.prior_ownership_pct is not None:
+        print(f"  Prior:     {report.prior_ownership_pct}%")
+    if report.purpose:
+        preview = report.purpose[:120].replace('\n', ' ')
+        print(f"  Purpose:   {preview}...")
+
+
+def parse_treasury_stock(report):
+    """Show a parsed treasury stock report (doc 220) — typed fields."""
     print("\n--- Treasury Stock Report (Doc 220) ---")
 
-    for doc in docs:
-        if doc.doc_type_code == "220":
-            report = doc.parse()  # → TreasuryStockReport
-            print(f"  Parser:    {type(report).__name__}")
-            print(f"  Company:   {report.filer_name}")
-            if report.filer_name_en:
-                print(f"             {report.filer_name_en}")
-            print(f"  Ticker:    {report.ticker}")
-            print(f"  Filed:     {report.filing_date}")
-            print(f"  Period:    {report.reporting_period}")
-            print(f"  Board auth:       {report.has_board_authorization}")
-            print(f"  Shareholder auth: {report.has_shareholder_authorization}")
-            return
-
-    print("  No doc 220 found in the last 5 days")
-
-
-def parse_securities_report(docs):
-    """Parse a securities report (doc 120) — rich financial data."""
+    if report is None:
+        print("  No doc 220 found in the last 5 days")
+        return
+
+    # report: TreasuryStockReport
+    print(f"  Parser:    {type(report).__name__}")
+    print(f"  Company:   {report.filer_name}")
+    if report.filer_name_en:
+        print(f"             {report.filer_name_en}")
+    print(f"  Ticker:    {report.ticker}")
+    print(f"  Filed:     {report.filing_date}")
+    print(f"  Period:    {report.reporting_period}")
+    print(f"  Board auth:       {report.has_board_authorization}")
+    print(f"  Shareholder auth: {report.has_shareholder_authorization}")
+
+
+def parse_securities_report(report):
+    """Show a parsed securities report (doc 120) — rich financial data."""
     print("\n--- Securities Report (Doc 120) ---")
 
-    for doc in docs:
-        if doc.doc_type_code == "120":
-            report = doc.parse()  # → SecuritiesReport
-            print(f"  Parser:       {type(report).__name__}")
-            print(f"  Company:      {report.filer_name}")
-            print(f"  Ticker:       {report.ticker}")
-            print(f"  FY end:       {report.fiscal_year_end}")
-            print(f"  Standard:     {report.accounting_standard}")
-            print(f"  Consolidated: {report.is_consolidated}")
-            if report.net_sales is not None:
-                print(f"  Net sales:    ¥{report.net_sales:,}")
-            if report.operating_income is not None:
-                print(f"  Op. income:   ¥{report.operating_income:,}")
-            if report.roe is not None:
-                print(f"  ROE:          {report.roe}%")
-            if report.equity_ratio is not None:
-                print(f"  Equity ratio: {report.equity_ratio}%")
-            return
-
-    print("  No doc 120 found in the last 5 days")
-
-
-def parse_internal_control(docs):
-    """Parse an internal control report (doc 235) — J-SOX compliance."""
+    if report is None:
+        print("  No doc 120 found in the last 5 days")
+        return
+
+    # report: SecuritiesReport
+    print(f"  Parser:       {type(report).__name__}")
+    print(f"  Company:      {report.filer_name}")
+    print(f"  Ticker:       {report.ticker}")
+    print(f"  FY end:       {report.fiscal_year_end}")
+    print(f"  Standard:     {report.accounting_standard}")
+    print(f"  Consolidated: {report.is_consolidated}")
+    if report.net_sales is not None:
+        print(f"  Net sales:    ¥{report.net_sales:,}")
+    if report.operating_income is not None:
+        print(f"  Op. income:   ¥{report.operating_income:,}")
+    if report.roe is not None:
+        print(f"  ROE:          {report.roe}%")
+    if report.equity_ratio is not None:
+        print(f"  Equity ratio: {report.equity_ratio}%")
+
+
+def parse_internal_control(report):
+    """Show a parsed internal control report (doc 235) — J-SOX compliance."""
     print("\n--- Internal Control Report (Doc 235) ---")
 
-    for doc in docs:
-        if doc.doc_type_code in ("235", "236"):
-            report = doc.parse()  # → InternalControlReport
-            print(f"  Parser:    {type(report).__name__}")
-            print(f"  Company:   {report.company_name or report.filer_name}")
-            print(f"  Filed:     {report.filing_date}")
-            if report.representative:
-                print(f"  Signed by: {report.representative}")
-            if report.cfo:
-                print(f"  CFO:       {report.cfo}")
-            if report.evaluation_result_text:
-                preview = report.evaluation_result_text[:120].replace('\n', ' ')
-                print(f"  Evaluation: {preview}...")
-            print(f"  Amendment: {report.is_amendment}")
-            return
-
-    print("  No doc 235/236 found in the last 5 days")
+    if report is None:
+        print("  No doc 235/236 found in the last 5 days")
+        return
+
+    # report: InternalControlReport
+    print(f"  Parser:    {type(report).__name__}")
+    print(f"  Company:   {report.company_name or report.filer_name}")
+    print(f"  Filed:     {report.filing_date}")
+    if report.representative:
+        print(f"  Signed by: {report.representative}")
+    if report.cfo:
+        print(f"  CFO:       {report.cfo}")
+    if report.evaluation_result_text:
+        preview = report.evaluation_result_text[:120].replace('\n', ' ')
+        print(f"  Evaluation: {preview}...")
+    print(f"  Amendment: {report.is_amendment}")
 
 
 # ── 4. Doc type registry ─────────────────────────────────────────
@@ -318,7 +350,7 @@ def show_shelf_registration_parser():
 # ── Main ──────────────────────────────────────────────────────────
 
 def main():
-    has_api_key = bool(os.getenv('EDINET_API_KEY'))
+    has_api_key = bool(getenv('EDINET_API_KEY'))
 
     print("EDINET Tools Quick Start")
     print("=" * 40)
@@ -344,10 +376,13 @@ def main():
     else:
         docs = list_documents()
         if docs:
-            parse_large_holding(docs)
-            parse_treasury_stock(docs)
-            parse_securities_report(docs)
-            parse_internal_control(docs)
+            reports = _parse_first_of_each(
+                docs, [("350",), ("220",), ("120",), ("235", "236")]
+            )
+            parse_large_holding(reports.get(("350",)))
+            parse_treasury_stock(reports.get(("220",)))
+            parse_securities_report(reports.get(("120",)))
+            parse_internal_control(reports.get(("235", "236")))
 
     print("\n" + "=" * 40)
     print("Getting Started:\n")
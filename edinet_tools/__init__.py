@@ -8,16 +8,12 @@ __version__ = "0.6.0"
 __author__ = "Matt Helmer"
 __description__ = "Python package for accessing Japanese corporate financial data from EDINET"
 
-# Core API
-from .client import EdinetClient  # Deprecated, but kept for migration
-from ._client import configure, documents, fetch_and_parse
-from .timezone import today_jst
-from .config import SUPPORTED_DOC_TYPES as DOCUMENT_TYPES
+import importlib
 
-# Entity classification
-from .entity_classifier import EntityClassifier, EntityType
-
-# Entity-first API
+# Entity-first API and doc type registry. Imported eagerly because the
+# functions `entity` and `doc_types` share their names with the submodules
+# that define them; binding them here keeps a later submodule import from
+# shadowing the function on the package.
 from .entity import (
     Entity,
     entity,
@@ -30,30 +26,59 @@ from .entity import (
     Fund,
     fund,
     funds_by_issuer,
+    clear_documents_cache,
 )
-from .normalize import normalize_for_matching
-from .document import Document
 from .doc_types import DocType, doc_type, list_doc_types, doc_types
 
-# Parsers
-from .parsers import (
-    parse,
-    supported_doc_types,
-    ParsedReport,
-    RawReport,
-    LargeHoldingReport,
-    SecuritiesReport,
-    QuarterlyReport,
-    SemiAnnualReport,
-    ExtraordinaryReport,
-    TreasuryStockReport,
-    TenderOfferReport,
-    InternalControlReport,
-    ConfirmationReport,
-    ParentCompanyReport,
-    LargeHoldingChangeReport,
-    GenericReport,  # Backwards compatibility alias
-)
+# Everything else is loaded on first attribute access (PEP 562), so that
+# `import edinet_tools` does not pull in pandas, the legacy client, or the
+# parser modules until they are used. Maps name -> (module, attribute).
+_LAZY = {
+    # Core API
+    "EdinetClient": (".client", "EdinetClient"),  # Deprecated, but kept for migration
+    "configure": ("._client", "configure"),
+    "documents": ("._client", "documents"),
+    "fetch_and_parse": ("._client", "fetch_and_parse"),
+    "today_jst": (".timezone", "today_jst"),
+    "DOCUMENT_TYPES": (".config", "SUPPORTED_DOC_TYPES"),
+    # Entity classification
+    "EntityClassifier": (".entity_classifier", "EntityClassifier"),
+    "EntityType": (".entity_classifier", "EntityType"),
+    "normalize_for_matching": (".normalize", "normalize_for_matching"),
+    "Document": (".document", "Document"),
+    # Parsers
+    "parse": (".parsers", "parse"),
+    "supported_doc_types": (".parsers", "supported_doc_types"),
+    "ParsedReport": (".parsers", "ParsedReport"),
+    "RawReport": (".parsers", "RawReport"),
+    "LargeHoldingReport": (".parsers", "LargeHoldingReport"),
+    "SecuritiesReport": (".parsers", "SecuritiesReport"),
+    "QuarterlyReport": (".parsers", "QuarterlyReport"),
+    "SemiAnnualReport": (".parsers", "SemiAnnualReport"),
+    "ExtraordinaryReport": (".parsers", "ExtraordinaryReport"),
+    "TreasuryStockReport": (".parsers", "TreasuryStockReport"),
+    "TenderOfferReport": (".parsers", "TenderOfferReport"),
+    "InternalControlReport": (".parsers", "InternalControlReport"),
+    "ConfirmationReport": (".parsers", "ConfirmationReport"),
+    "ParentCompanyReport": (".parsers", "ParentCompanyReport"),
+    "LargeHoldingChangeReport": (".parsers", "LargeHoldingChangeReport"),
+    "GenericReport": (".parsers", "GenericReport"),  # Backwards compatibility alias
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Configuration
@@ -75,6 +100,7 @@ __all__ = [
     "Fund",
     "fund",
     "funds_by_issuer",
+    "clear_documents_cache",
     "normalize_for_matching",
     # Documents
     "Document",
@@ -4,14 +4,14 @@ Module-level client singleton for EDINET API access.
 Provides lazy initialization of EdinetClient from environment variables
 or explicit configuration.
 """
-import os
-import warnings
 from typing import Optional
 
 from .client import EdinetClient
+from .config import getenv
 
-# Module-level state
-_client: Optional[EdinetClient] = None
+# Module-level state. Only the most recent (api_key, client) pair is kept, so
+# switching keys never accumulates clients
+_client_entry: Optional[tuple[Optional[str], EdinetClient]] = None
 _configured_api_key: Optional[str] = None
 
 
@@ -20,24 +20,30 @@ def _get_client() -> EdinetClient:
     Get the module-level EdinetClient instance.
 
     Lazily initializes from EDINET_API_KEY env var or configure() call.
+    The client is cached along with its API key, so changing EDINET_API_KEY
+    at runtime picks up a fresh client while repeated calls with the same key
+    reuse one.
 
     Returns:
         EdinetClient instance
+
+    Raises:
+        ConfigurationError: If no API key is configured or set in the environment
     """
-    global _client
-    if _client is None:
-        api_key = _configured_api_key or os.environ.get('EDINET_API_KEY')
-        # Suppress deprecation warning for internal usage
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            _client = EdinetClient(api_key=api_key)
-    return _client
+    global _client_entry
+    api_key = _configured_api_key or getenv('EDINET_API_KEY')
+    entry = _client_entry
+    if entry is not None and entry[0] == api_key:
+        return entry[1]
+    client = EdinetClient(api_key=api_key, _internal=True)
+    _client_entry = (api_key, client)
+    return client
 
 
 def _reset_client() -> None:
     """Reset the client singleton (for testing)."""
-    global _client
-    _client = None
+    global _client_entry
+    _client_entry = None
 
 
 def configure(api_key: Optional[str] = None) -> None:
@@ -47,9 +53,9 @@ def configure(api_key: Optional[str] = None) -> None:
     Args:
         api_key: EDINET API key (if None, uses EDINET_API_KEY env var)
     """
-    global _configured_api_key, _client
+    global _configured_api_key, _client_entry
     _configured_api_key = api_key
-    _client = None  # Reset so next _get_client() uses new config
+    _client_entry = None  # Reset so next _get_client() uses new config
 
 
 def fetch_and_parse(doc_id: str, doc_type_code: str):
@@ -92,7 +98,8 @@ def documents(date: Optional[str] = None, doc_type: Optional[str] = None) -> lis
     client = _get_client()
     filings = client.get_documents_by_date(date)
 
-    if doc_type:
-        filings = [f for f in filings if f.get('docTypeCode') == doc_type]
-
-    return [Document(f, client=client) for f in filings]
+    # Filter and wrap in one pass so only matching filings become Documents
+    return [
+        Document(f, client=client) for f in filings
+        if not doc_type or f.get('docTypeCode') == doc_type
+    ]
@@ -0,0 +1,93 @@
+"""
+On-disk cache for indexes parsed from the bundled FSA CSVs.
+
+Parsing EdinetcodeDlInfo.csv / FundcodeDlInfo.csv costs tens of milliseconds
+per process; unpickling the resulting indexes is several times faster. Cache
+files live in the user's cache directory (the package data directory may be
+read-only) and are keyed on the source CSV's path, mtime and size, so a
+replaced CSV is re-parsed automatically.
+
+Set EDINET_TOOLS_CACHE_DIR to use a different directory, or to an empty
+string to disable the cache. Any error reading or writing a cache file is
+treated as a miss.
+"""
+import os
+import pickle
+import tempfile
+from typing import Any, Callable
+
+from .config import getenv
+
+# Bump when the layout of any cached payload changes
+_CACHE_FORMAT = 1
+
+
+def _cache_dir() -> str | None:
+    """Directory for cache files, or None if caching is disabled."""
+    configured = getenv('EDINET_TOOLS_CACHE_DIR')
+    if configured is not None:
+        return configured or None
+    base = getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'edinet-tools')
+
+
+def _cache_key(source_path: str, name: str) -> tuple:
+    from . import __version__  # a new release may index the same CSV differently
+
+    st = os.stat(source_path)
+    return (_CACHE_FORMAT, __version__, name, os.path.abspath(source_path),
+            st.st_mtime_ns, st.st_size)
+
+
+def _cache_path(cache_dir: str, source_path: str, name: str) -> str:
+    return os.path.join(cache_dir, f"{os.path.basename(source_path)}.{name}.pkl")
+
+
+def load(source_path: str, name: str) -> Any | None:
+    """
+    Return the payload cached for source_path under name, or None.
+
+    Args:
+        source_path: CSV the payload was built from
+        name: Payload name, including its own schema version (e.g. 'funds-v1')
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        key = _cache_key(source_path, name)
+        with open(_cache_path(cache_dir, source_path, name), 'rb') as f:
+            cached_key, payload = pickle.load(f)
+    except Exception:
+        return None
+    return payload if cached_key == key else None
+
+
+def store(source_path: str, name: str, payload: Any) -> None:
+    """Cache payload for source_path under name. Failures are ignored."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        key = _cache_key(source_path, name)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file and rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _cache_path(cache_dir, source_path, name))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
+
+
+def load_or_build(source_path: str, name: str, build: Callable[[], Any]) -> Any:
+    """Return the cached payload for source_path, or build() and cache it."""
+    payload = load(source_path, name)
+    if payload is None:
+        payload = build()
+        store(source_path, name, payload)
+    return payload
@@ -0,0 +1,56 @@
+"""
+Encoding detection for EDINET CSV files.
+
+EDINET's XBRL_TO_CSV files are UTF-16LE with a BOM, so the BOM settles
+almost every file. Other CSVs turn up as UTF-8 or as one of the 8-bit
+Japanese encodings. Shared by the XBRL CSV parser (parser.py, which reads
+extracted files) and the typed parsers (parsers/extraction.py, which read
+ZIP members), so both try the same encodings in the same order.
+"""
+import codecs
+
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),  # 'utf-16' reads the BOM and strips it
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Tried in order for files without a BOM or NUL bytes. EUC-JP goes before
+# CP932: almost any byte string decodes as CP932 (its single-byte half-width
+# katakana cover EUC-JP's bytes), while Shift-JIS / CP932 lead bytes
+# 0x81-0x9F are invalid in EUC-JP. CP932 is the superset of Shift-JIS that
+# Japanese Windows writes, so it also reads plain Shift-JIS.
+FALLBACK_ENCODINGS = ('utf-8', 'euc-jp', 'cp932')
+
+# Bytes from the start of a file used to pick its encoding
+SAMPLE_SIZE = 4096
+
+
+def sniff_encoding(sample: bytes) -> str:
+    """
+    Pick the most likely encoding for a file from its first few KB.
+
+    A BOM settles it. Without one, NUL bytes mean UTF-16LE (8-bit Japanese
+    encodings never contain them); otherwise the first fallback encoding
+    that decodes the sample wins. The sample may not represent the whole
+    file, so callers should still decode strictly (see candidate_encodings).
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+    if b'\x00' in sample:
+        return 'utf-16le'
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            # Incremental, so a character cut off at the end of the sample is not an error
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return FALLBACK_ENCODINGS[-1]
+
+
+def candidate_encodings(sample: bytes) -> list[str]:
+    """Encodings to try in order: the sniffed one, then the other fallbacks."""
+    sniffed = sniff_encoding(sample)
+    return [sniffed, *(e for e in FALLBACK_ENCODINGS if e != sniffed)]
@@ -13,7 +13,7 @@ from typing import List, Dict, Any, Optional, Union
 import logging
 
 from .api import fetch_documents_list, fetch_document, download_documents
-from .config import SUPPORTED_DOC_TYPES as DOCUMENT_TYPES
+from .config import SUPPORTED_DOC_TYPES as DOCUMENT_TYPES, getenv
 from .utils import process_zip_file
 from .processors import process_raw_csv_data
 from .data import resolve_company, search_companies as search_companies_data, get_company_info
@@ -42,26 +42,30 @@ class EdinetClient:
         >>> client.download_filing(filings[0]["docID"])
     """
     
-    def __init__(self, api_key: Optional[str] = None, download_dir: str = "./downloads"):
+    def __init__(self, api_key: Optional[str] = None, download_dir: str = "./downloads",
+                 _internal: bool = False):
         """
         Initialize EDINET client.
 
         Args:
             api_key: EDINET API key. If None, will look for EDINET_API_KEY environment variable.
             download_dir: Directory to store downloaded documents.
+            _internal: Set by the package's own module-level client to skip
+                the deprecation warning. Not for external use.
 
         .. deprecated:: 0.2.0
             Use module-level functions instead: edinet.configure(), edinet.entity(),
             edinet.documents(). See migration guide in README.
         """
-        warnings.warn(
-            "EdinetClient is deprecated. Use module-level functions instead: "
-            "edinet.configure(), edinet.entity(), edinet.documents(). "
-            "See migration guide in README.",
-            DeprecationWarning,
-            stacklevel=2
-        )
-        self.api_key = api_key or os.getenv('EDINET_API_KEY')
+        if not _internal:
+            warnings.warn(
+                "EdinetClient is deprecated. Use module-level functions instead: "
+                "edinet.configure(), edinet.entity(), edinet.documents(). "
+                "See migration guide in README.",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        self.api_key = api_key or getenv('EDINET_API_KEY')
         if not self.api_key:
             raise ConfigurationError(
                 "EDINET API key required.",
@@ -1,86 +1,189 @@
 # config.py
 import os
-import logging
-from dotenv import load_dotenv
-
-# Load environment variables from project root
-project_root = os.path.dirname(os.path.dirname(__file__))  # Go up one level from edinet_tools/
-dotenv_path = os.path.join(project_root, '.env')
-if os.path.exists(dotenv_path):
-    load_dotenv(dotenv_path)
-else:
-    # Try loading from current working directory as fallback
-    load_dotenv()
-
-EDINET_API_KEY = os.environ.get('EDINET_API_KEY')
-
-# Unified LLM API Key - can be Gemini, Claude, OpenAI, etc. depending on llm plugin
-# Check multiple common API key environment variables
-LLM_API_KEY = (
-    os.environ.get('LLM_API_KEY') or
-    os.environ.get('GOOGLE_API_KEY') or
-    os.environ.get('ANTHROPIC_API_KEY') or
-    os.environ.get('OPENAI_API_KEY')
+from types import MappingProxyType
+
+# Locate the .env file in the project root (one level up from edinet_tools/)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+dotenv_path = os.path.join(_PROJECT_ROOT, '.env')
+
+# Settings resolved from the environment. These are computed on first access
+# (see __getattr__ below) so that importing the package never touches .env
+# unless a setting is actually needed.
+_ENV_SETTINGS = (
+    'EDINET_API_KEY',
+    'LLM_API_KEY',
+    'LLM_API_KEY_SOURCE',
+    'LLM_MODEL',
+    'LLM_FALLBACK_MODEL',
+    'AZURE_OPENAI_API_KEY',
+    'AZURE_OPENAI_ENDPOINT',
+    'AZURE_OPENAI_API_VERSION',
+    'AZURE_OPENAI_DEPLOYMENT',
 )
 
-# Specify default LLM model names (via llm library - install plugins as needed)
-# Popular options: claude-4-sonnet, gpt-4o-mini, gemini-2.0-flash (requires llm-gemini)
-LLM_MODEL = os.environ.get('LLM_MODEL', 'claude-4-sonnet')
-LLM_FALLBACK_MODEL = os.environ.get('LLM_FALLBACK_MODEL', 'gpt-4o-mini')
+# Unified LLM API Key - can be Gemini, Claude, OpenAI, etc. depending on llm plugin.
+# Checked in this order; the first non-empty variable wins.
+_LLM_API_KEY_VARS = ('LLM_API_KEY', 'GOOGLE_API_KEY', 'ANTHROPIC_API_KEY', 'OPENAI_API_KEY')
+
+_env_loaded = False
+
+
+def _parse_env_lines(lines) -> dict:
+    """
+    Parse KEY=VALUE lines from a .env file.
+
+    Supports blank lines, # comments, an optional `export ` prefix, single-
+    or double-quoted values, and trailing # comments on unquoted values.
+    """
+    values = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        if line.startswith('export '):
+            line = line[7:]
+        key, value = line.split('=', 1)
+        key = key.strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        elif ' #' in value:
+            value = value.split(' #', 1)[0].rstrip()
+        if key:
+            values[key] = value
+    return values
+
+
+def _load_env() -> None:
+    """Load the .env file into os.environ once, if one exists."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    # Fall back to the current working directory if the project root has none
+    for path in (dotenv_path, os.path.join(os.getcwd(), '.env')):
+        # Open directly rather than exists() + open(): one syscall, no race
+        try:
+            fh = open(path, encoding='utf-8')
+        except FileNotFoundError:
+            continue
+        with fh:
+            values = _parse_env_lines(fh)
+        # Existing environment variables win, as with python-dotenv
+        for key, value in values.items():
+            os.environ.setdefault(key, value)
+        return
+
+
+def _load_env_unless_set(var: str) -> None:
+    """
+    Load .env only if it could change the value of var.
 
-AZURE_OPENAI_API_KEY = os.environ.get('AZURE_OPENAI_API_KEY')
-AZURE_OPENAI_ENDPOINT = os.environ.get('AZURE_OPENAI_ENDPOINT')
-AZURE_OPENAI_API_VERSION = os.environ.get('AZURE_OPENAI_API_VERSION')
-AZURE_OPENAI_DEPLOYMENT = os.environ.get('AZURE_OPENAI_DEPLOYMENT')
+    .env never overrides the environment, so when var is already set (as in
+    containers and CI, where secrets are injected) reading the file is wasted
+    work and is skipped.
+    """
+    if var not in os.environ:
+        _load_env()
 
 
-# Check for required keys and log warnings if missing
-if not EDINET_API_KEY:
-    logging.warning("EDINET_API_KEY not set in .env file.")
+def getenv(name: str, default=None):
+    """
+    Read an environment variable, falling back to the .env file.
+
+    Use this instead of os.getenv() for settings that may live in .env:
+    importing the package no longer loads .env into os.environ, so os.getenv()
+    only sees it once some setting has been resolved. Unlike the module-level
+    settings, the value is not cached, so later changes to os.environ are seen.
+    """
+    _load_env_unless_set(name)
+    return os.environ.get(name, default)
+
+
+def _resolve_llm_api_key() -> tuple:
+    """Return (key, name of the variable it came from), or (None, None)."""
+    for var in _LLM_API_KEY_VARS:
+        value = os.environ.get(var)
+        if value:
+            return value, var
+    return None, None
+
+
+def _resolve(name: str):
+    """Compute the value of an environment-backed setting."""
+    _load_env_unless_set(name)
+
+    # Specify default LLM model names (via llm library - install plugins as needed)
+    # Popular options: claude-4-sonnet, gpt-4o-mini, gemini-2.0-flash (requires llm-gemini)
+    if name == 'LLM_MODEL':
+        return os.environ.get('LLM_MODEL', 'claude-4-sonnet')
+    if name == 'LLM_FALLBACK_MODEL':
+        return os.environ.get('LLM_FALLBACK_MODEL', 'gpt-4o-mini')
+
+    return os.environ.get(name)
+
+
+def __getattr__(name: str):
+    if name in ('LLM_API_KEY', 'LLM_API_KEY_SOURCE'):
+        # Resolved together so the key and its source always agree. A non-empty
+        # LLM_API_KEY takes priority over everything .env could add.
+        if not os.environ.get('LLM_API_KEY'):
+            _load_env()
+        globals()['LLM_API_KEY'], globals()['LLM_API_KEY_SOURCE'] = _resolve_llm_api_key()
+        return globals()[name]
+    if name in _ENV_SETTINGS:
+        value = _resolve(name)
+        globals()[name] = value  # cache: later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-if not LLM_API_KEY:
-    logging.warning("No LLM API key found (set GOOGLE_API_KEY, ANTHROPIC_API_KEY, or OPENAI_API_KEY). LLM analysis disabled.")
 
 # Complete EDINET document types mapping
-# Based on official EDINET documentation and API specifications
-SUPPORTED_DOC_TYPES = {
-    "010": "Securities Notification",
-    "020": "Amendment Notification (Securities Notification)",
-    "030": "Securities Registration Statement",
-    "040": "Amended Securities Registration Statement",
-    "050": "Withdrawal Request for Registration",
-    "060": "Issuance Registration Notification",
-    "070": "Amendment Notification (Issuance Registration Notification)",
-    "080": "Issuance Registration Statement",
-    "090": "Amended Issuance Registration Statement",
-    "100": "Supplementary Issuance Registration Document",
-    "110": "Issuance Registration Withdrawal Statement",
-    "120": "Securities Report",
-    "130": "Securities Report (Amended)",
-    "135": "Confirmation Document",
-    "136": "Amended Confirmation Document",
-    "140": "Quarterly Report",
-    "150": "Quarterly Report (Amended)",
-    "160": "Semi-Annual Report",
-    "170": "Semi-Annual Report (Amended)",
-    "180": "Extraordinary Report",
-    "190": "Amended Extraordinary Report",
-    "200": "Parent Company Status Report",
-    "210": "Amended Parent Company Status Report",
-    "220": "Treasury Stock Purchase Status Report",
-    "230": "Amended Treasury Stock Purchase Status Report",
-    "235": "Internal Control Report",
-    "236": "Amended Internal Control Report",
-    "240": "Tender Offer Registration",
-    "250": "Amended Tender Offer Registration Statement",
-    "260": "Tender Offer Withdrawal",
-    "270": "Tender Offer Report",
-    "280": "Amended Tender Offer Report",
-    "300": "Amended Statement of Opinion Report",
-    "320": "Amended Response to Questions Report",
-    "340": "Amended Application for Exemption from Separate Purchase Prohibition",
-    "350": "Large Holding Report",
-    "360": "Amended Large Shareholding Report",
-    "370": "Reference Date Notification",
-    "380": "Change Notification",
-}
+# Based on official EDINET documentation and API specifications.
+# Kept as a literal tuple of string pairs: the compiler folds it into a single
+# constant in the cached .pyc, so import loads it in one LOAD_CONST.
+_DOC_TYPES_ITEMS = (
+    ("010", "Securities Notification"),
+    ("020", "Amendment Notification (Securities Notification)"),
+    ("030", "Securities Registration Statement"),
+    ("040", "Amended Securities Registration Statement"),
+    ("050", "Withdrawal Request for Registration"),
+    ("060", "Issuance Registration Notification"),
+    ("070", "Amendment Notification (Issuance Registration Notification)"),
+    ("080", "Issuance Registration Statement"),
+    ("090", "Amended Issuance Registration Statement"),
+    ("100", "Supplementary Issuance Registration Document"),
+    ("110", "Issuance Registration Withdrawal Statement"),
+    ("120", "Securities Report"),
+    ("130", "Securities Report (Amended)"),
+    ("135", "Confirmation Document"),
+    ("136", "Amended Confirmation Document"),
+    ("140", "Quarterly Report"),
+    ("150", "Quarterly Report (Amended)"),
+    ("160", "Semi-Annual Report"),
+    ("170", "Semi-Annual Report (Amended)"),
+    ("180", "Extraordinary Report"),
+    ("190", "Amended Extraordinary Report"),
+    ("200", "Parent Company Status Report"),
+    ("210", "Amended Parent Company Status Report"),
+    ("220", "Treasury Stock Purchase Status Report"),
+    ("230", "Amended Treasury Stock Purchase Status Report"),
+    ("235", "Internal Control Report"),
+    ("236", "Amended Internal Control Report"),
+    ("240", "Tender Offer Registration"),
+    ("250", "Amended Tender Offer Registration Statement"),
+    ("260", "Tender Offer Withdrawal"),
+    ("270", "Tender Offer Report"),
+    ("280", "Amended Tender Offer Report"),
+    ("300", "Amended Statement of Opinion Report"),
+    ("320", "Amended Response to Questions Report"),
+    ("340", "Amended Application for Exemption from Separate Purchase Prohibition"),
+    ("350", "Large Holding Report"),
+    ("360", "Amended Large Shareholding Report"),
+    ("370", "Reference Date Notification"),
+    ("380", "Change Notification"),
+)
+
+# Read-only view: shared by every importer and safe from accidental mutation
+SUPPORTED_DOC_TYPES = MappingProxyType(dict(_DOC_TYPES_ITEMS))
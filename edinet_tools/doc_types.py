@@ -5,10 +5,12 @@ Provides metadata about document types including English/Japanese names
 and descriptions. Every doc type code a user might encounter is registered
 here, even those without typed parsers.
 """
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocType:
     """
     EDINET document type metadata.
@@ -32,7 +34,7 @@ class DocType:
 # Organized by family: securities notification/registration (010-110),
 # periodic reports (120-210), treasury/internal control (220-236),
 # tender offer (240-340), large shareholding (350-380).
-_DOC_TYPES: dict[str, DocType] = {
+_DOC_TYPES_BY_CODE: dict[str, DocType] = {
 
     # === Securities Notification (有価証券通知書) family (010-020) ===
     "010": DocType(
@@ -301,6 +303,15 @@ _DOC_TYPES: dict[str, DocType] = {
     ),
 }
 
+# Read-only view: the registry is shared by every caller. doc_type() reads
+# the plain dict directly, skipping the proxy's extra indirection per lookup.
+_DOC_TYPES: Mapping[str, DocType] = MappingProxyType(_DOC_TYPES_BY_CODE)
+
+# Registry values sorted by code, built once for list_doc_types()
+_DOC_TYPES_TUPLE: tuple[DocType, ...] = tuple(
+    sorted(_DOC_TYPES_BY_CODE.values(), key=lambda dt: dt.code)
+)
+
 
 def doc_type(code: str) -> DocType | None:
     """
@@ -312,7 +323,7 @@ def doc_type(code: str) -> DocType | None:
     Returns:
         DocType object or None if not found
     """
-    return _DOC_TYPES.get(code)
+    return _DOC_TYPES_BY_CODE.get(code)
 
 
 def list_doc_types() -> list[DocType]:
@@ -322,7 +333,7 @@ def list_doc_types() -> list[DocType]:
     Returns:
         List of all DocType objects
     """
-    return list(_DOC_TYPES.values())
+    return list(_DOC_TYPES_TUPLE)
 
 
 # Shorter alias (v0.2)
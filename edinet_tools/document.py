@@ -4,8 +4,13 @@ Document class for EDINET filings.
 Wraps EDINET API responses with convenient accessors.
 """
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
+from .doc_types import doc_type as _get_doc_type
+from .entity import entity_by_edinet_code
+from .timezone import JST
+
 
 class Document:
     """
@@ -31,8 +36,7 @@ class Document:
     @property
     def doc_type(self):
         """Document type as DocType object."""
-        from .doc_types import doc_type as get_doc_type
-        return get_doc_type(self.doc_type_code)
+        return _get_doc_type(self.doc_type_code)
 
     @property
     def doc_type_name(self) -> str | None:
@@ -50,26 +54,28 @@ class Document:
         """Name of the filing entity (from API response)."""
         return self._data.get('filerName', '')
 
-    @property
+    @cached_property
     def filing_datetime(self) -> datetime | None:
-        """When the document was filed."""
+        """When the document was filed (parsed once, on first access)."""
         submit_dt = self._data.get('submitDateTime', '')
         if submit_dt:
+            # EDINET sends 'YYYY-MM-DD HH:MM' (sometimes just 'YYYY-MM-DD').
+            # fromisoformat parses both in C, far faster than strptime.
             try:
-                return datetime.strptime(submit_dt, '%Y-%m-%d %H:%M')
+                dt = datetime.fromisoformat(submit_dt)
             except ValueError:
-                # Try alternative format
-                try:
-                    return datetime.strptime(submit_dt, '%Y-%m-%d')
-                except ValueError:
-                    return None
+                return None
+            # It also accepts a UTC offset; keep results naive JST, as
+            # EDINET's own timestamps are, so they all compare
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(JST).replace(tzinfo=None)
+            return dt
         return None
 
     @property
     def filer(self):
         """The Entity that filed this document."""
         if self.filer_edinet_code:
-            from .entity import entity_by_edinet_code
             return entity_by_edinet_code(self.filer_edinet_code)
         return None
 
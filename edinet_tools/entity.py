@@ -5,20 +5,62 @@ Entity wraps company/individual data from EdinetcodeDlInfo.csv.
 Fund wraps investment fund data from FundcodeDlInfo.csv.
 """
 import csv
+import heapq
 import logging
 import re
-from typing import Any
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+from . import _disk_cache
 from .entity_classifier import EntityClassifier
+from .normalize import normalize_for_matching
+from .timezone import today_jst
+
+# Identifier patterns used by entity() to dispatch lookups
+_EDINET_RE = re.compile(r'^E\d{5}$')
+_TICKER_RE = re.compile(r'^(\d{4,5})(\.T)?$', re.IGNORECASE)
+
+# Concurrent daily-index requests made by Entity.documents()
+_DOCUMENTS_MAX_WORKERS = 8
+
+# Past days' filing indexes kept per client for Entity.documents()
+_PAST_DOCUMENTS_MAX_DAYS = 64
+
+# On-disk cache entry for the parsed fund registry; bump the suffix when the
+# layout of _FundRecord or the cached tuple changes
+_FUNDS_CACHE_NAME = 'funds-v1'
+
+
+class _FundRecord(NamedTuple):
+    """One row of FundcodeDlInfo.csv, as stored in the fund cache."""
+    fund_code: str
+    securities_code: str | None
+    name: str
+    name_phonetic: str | None
+    fund_type: str | None
+    accounting_date_1: str | None
+    accounting_date_2: str | None
+    issuer_edinet_code: str
+    issuer_name: str
 
 
 # Module-level cache for classifier instance
 _classifier: EntityClassifier | None = None
-# Module-level cache for fund data
-_funds: dict[str, dict] | None = None
+# Module-level cache for fund data. Records are tuples rather than dicts:
+# the registry holds thousands of funds but only a few are ever wrapped.
+_funds: dict[str, _FundRecord] | None = None
 _funds_by_issuer: dict[str, list[str]] | None = None
+_fund_names_lower: list[tuple[str, str]] | None = None  # (fund_code, lowercased name)
+# Module-level cache for the substring-search index, and the classifier it
+# was built from (rebuilt if the classifier is ever replaced)
+_search_index: list[tuple] | None = None
+_search_index_source: EntityClassifier | None = None
 
 
 def _get_classifier() -> EntityClassifier:
@@ -29,6 +71,76 @@ def _get_classifier() -> EntityClassifier:
     return _classifier
 
 
+# Past days' filing indexes, per client (see _past_documents_by_date). Keyed
+# weakly, so a cache is dropped with its client (e.g. after configure()).
+# Each client keeps its most recently used days, oldest evicted first.
+_past_documents: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_past_documents_lock = threading.Lock()
+
+
+def _past_documents_by_date(client: Any, check_date) -> list[dict]:
+    """
+    Fetch a past day's filing index, shared across Entity.documents() calls.
+
+    Every entity reads the same daily index and filters it client-side, so
+    looking up several entities over the same window would otherwise refetch
+    each day once per entity. Only days before today (JST) go through this
+    cache; today's index is still growing. Failed fetches are not cached.
+    """
+    with _past_documents_lock:
+        cache = _past_documents.get(client)
+        if cache is None:
+            cache = _past_documents[client] = OrderedDict()
+        documents = cache.get(check_date)
+        if documents is not None:
+            cache.move_to_end(check_date)
+            return documents
+
+    documents = client.get_documents_by_date(check_date)
+    with _past_documents_lock:
+        cache[check_date] = documents
+        if len(cache) > _PAST_DOCUMENTS_MAX_DAYS:
+            cache.popitem(last=False)
+    return documents
+
+
+def clear_documents_cache() -> None:
+    """
+    Forget the past days' filing indexes cached by Entity.documents().
+
+    Past days are fetched once per client and then reused, so a filing's
+    later withdrawal or status change is not seen until the cache is
+    cleared (or the day is evicted). Call this in long-running processes
+    that need current statuses.
+    """
+    with _past_documents_lock:
+        _past_documents.clear()
+
+
+def _get_search_index(classifier: EntityClassifier) -> list[tuple]:
+    """
+    Get the flattened entity list scanned by search_entities().
+
+    Each entry is (edinet_code, normalized_jp, normalized_en, is_listed,
+    name_len), so the per-query scan reads tuple fields instead of doing
+    several dict lookups per entity.
+    """
+    global _search_index, _search_index_source
+    if _search_index is None or _search_index_source is not classifier:
+        _search_index = [
+            (
+                edinet_code,
+                raw.normalized or '',
+                raw.normalized_en or '',
+                raw.is_listed,
+                len(raw.name_en or '') or len(raw.name_jp or '') or 999,
+            )
+            for edinet_code, raw in classifier._edinet_entities.items()
+        ]
+        _search_index_source = classifier
+    return _search_index
+
+
 class Entity:
     """
     An EDINET-registered entity (company, fund issuer, individual).
@@ -36,6 +148,8 @@ class Entity:
     Wraps data from EdinetcodeDlInfo.csv with convenient accessors.
     """
 
+    __slots__ = ('_data', '_client')
+
     def __init__(self, data: dict[str, Any], client: Any = None):
         self._data = data
         self._client = client
@@ -125,10 +239,10 @@ class Entity:
         Returns:
             List of Document objects
         """
+        # Imported here: document imports this module, and _client pulls in
+        # the legacy client, which package import deliberately defers
         from .document import Document
         from ._client import _get_client
-        from .timezone import today_jst
-        from datetime import timedelta
 
         # Handle deprecated parameter
         if days_back is not None and days is None:
@@ -139,35 +253,40 @@ class Entity:
         # Use explicit client if set, otherwise module-level client
         client = self._client if self._client is not None else _get_client()
 
-        # Collect filings from each day (JST so we don't miss today's filings)
-        all_filings = []
+        # Collect filings from each day (JST so we don't miss today's filings).
+        # Each day is a separate API request, so fetch them concurrently.
         today = today_jst()
-        for i in range(days):
-            check_date = today - timedelta(days=i)
+        check_dates = [today - timedelta(days=i) for i in range(days)]
+
+        def fetch(check_date):
             try:
-                filings = client.get_documents_by_date(check_date)
-                all_filings.extend(filings)
-            except (AttributeError, TypeError) as e:
+                if check_date < today:
+                    return _past_documents_by_date(client, check_date)
+                return client.get_documents_by_date(check_date)
+            except (AttributeError, TypeError):
                 # Programming errors should not be silently swallowed
                 raise
             except Exception as e:
                 # Log API/network errors but continue with other dates
                 logger.debug(f"Failed to fetch documents for {check_date}: {e}")
-                continue
+                return []
 
-        # Filter by this entity's EDINET code
+        all_filings = []
+        if check_dates:
+            workers = min(_DOCUMENTS_MAX_WORKERS, len(check_dates))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map() yields in submission order, so results stay newest-first
+                for filings in pool.map(fetch, check_dates):
+                    all_filings.extend(filings)
+
+        # Filter by this entity's EDINET code (and doc type, if given) in one pass
+        edinet_code = self.edinet_code
         my_filings = [
             f for f in all_filings
-            if f.get('edinetCode') == self.edinet_code
+            if f.get('edinetCode') == edinet_code
+            and (not doc_type or f.get('docTypeCode') == doc_type)
         ]
 
-        # Filter by doc type if specified
-        if doc_type:
-            my_filings = [
-                f for f in my_filings
-                if f.get('docTypeCode') == doc_type
-            ]
-
         # Convert to Document objects (pass client for fetch())
         return [Document(f, client=client) for f in my_filings]
 
@@ -189,14 +308,14 @@ def _build_entity_from_classifier(edinet_code: str, classifier: EntityClassifier
 
     data = {
         'edinet_code': edinet_code,
-        'name_jp': raw.get('name_jp', ''),
-        'name_en': raw.get('name_en') or None,
-        'name_phonetic': raw.get('name_phonetic') or None,
+        'name_jp': raw.name_jp,
+        'name_en': raw.name_en or None,
+        'name_phonetic': raw.name_phonetic or None,
         'ticker': ticker,
-        'is_listed': raw.get('is_listed', False),
-        'submitter_type': raw.get('submitter_type'),
-        'industry': raw.get('industry') or None,
-        'corporate_number': raw.get('corporate_number') or None,
+        'is_listed': raw.is_listed,
+        'submitter_type': raw.submitter_type,
+        'industry': raw.industry or None,
+        'corporate_number': raw.corporate_number or None,
     }
     return Entity(data)
 
@@ -249,7 +368,7 @@ def entity_by_ticker(ticker: str) -> Entity | None:
         return None
 
     # Strip .T or .t suffix if present (Tokyo Stock Exchange suffix)
-    if ticker.upper().endswith('.T'):
+    if ticker.endswith(('.T', '.t')):
         ticker = ticker[:-2]
 
     classifier = _get_classifier()
@@ -319,8 +438,6 @@ def search_entities(query: str, limit: int = 10) -> list[Entity]:
     if not query or not query.strip():
         return []
 
-    from .normalize import normalize_for_matching
-
     classifier = _get_classifier()
     q_norm = normalize_for_matching(query)
 
@@ -343,8 +460,8 @@ def search_entities(query: str, limit: int = 10) -> list[Entity]:
         ranked = []
         for code in exact_codes:
             raw = classifier._edinet_entities[code]
-            listed_penalty = 0 if raw.get('is_listed') else 500
-            name_len = len(raw.get('name_en') or raw.get('name_jp') or '')
+            listed_penalty = 0 if raw.is_listed else 500
+            name_len = len(raw.name_en or raw.name_jp or '')
             ranked.append((listed_penalty, name_len, code))
         ranked.sort(key=lambda x: (x[0], x[1]))
         results = []
@@ -356,10 +473,7 @@ def search_entities(query: str, limit: int = 10) -> list[Entity]:
 
     # Substring-scan fallback (O(N)): use pre-normalized forms on both sides
     matches = []
-    for edinet_code, raw in classifier._edinet_entities.items():
-        norm_jp = raw.get('_normalized', '')
-        norm_en = raw.get('_normalized_en', '')
-
+    for edinet_code, norm_jp, norm_en, is_listed, name_len in _get_search_index(classifier):
         if q_norm in norm_jp or q_norm in norm_en:
             score = 1000  # Base score (only reached if not exact — exact was index-handled above)
 
@@ -371,16 +485,17 @@ def search_entities(query: str, limit: int = 10) -> list[Entity]:
                 pos_jp = norm_jp.find(q_norm) if q_norm in norm_jp else 999
                 score = 200 + min(pos_en, pos_jp)
 
-            if not raw.get('is_listed', False):
+            if not is_listed:
                 score += 500
 
-            name_len = len(raw.get('name_en') or '') or len(raw.get('name_jp') or '') or 999
             matches.append((score, name_len, edinet_code))
 
-    matches.sort(key=lambda x: (x[0], x[1]))
+    # Bounded selection: O(N log limit) rather than sorting every match.
+    # Like sorted(), nsmallest keeps ties in registry order.
+    top = heapq.nsmallest(limit, matches, key=lambda x: (x[0], x[1]))
 
     results = []
-    for score, name_len, edinet_code in matches[:limit]:
+    for score, name_len, edinet_code in top:
         e = _build_entity_from_classifier(edinet_code, classifier)
         if e:
             results.append(e)
@@ -423,12 +538,11 @@ def entity(identifier: str) -> Entity | None:
         return None
 
     # Check for EDINET code pattern
-    if re.match(r'^E\d{5}$', identifier):
+    if _EDINET_RE.match(identifier):
         return entity_by_edinet_code(identifier)
 
     # Check for ticker pattern (4-5 digits, optional .T suffix)
-    ticker_match = re.match(r'^(\d{4,5})(\.T)?$', identifier, re.IGNORECASE)
-    if ticker_match:
+    if _TICKER_RE.match(identifier):
         return entity_by_ticker(identifier)
 
     # Fall back to name search
@@ -436,48 +550,62 @@ def entity(identifier: str) -> Entity | None:
     return results[0] if results else None
 
 
-def _load_funds() -> tuple[dict[str, dict], dict[str, list[str]]]:
+def _load_funds() -> tuple[dict[str, _FundRecord], dict[str, list[str]]]:
     """Load and index fund data from FundcodeDlInfo.csv."""
-    global _funds, _funds_by_issuer
+    global _funds, _funds_by_issuer, _fund_names_lower
     if _funds is not None:
         return _funds, _funds_by_issuer
 
-    classifier = _get_classifier()
-    _funds = {}
-    _funds_by_issuer = {}
+    fund_codes_path = _get_classifier().fund_codes_path
+
+    # Reuse the indexes from a previous process if the CSV is unchanged
+    funds, _funds_by_issuer, _fund_names_lower = _disk_cache.load_or_build(
+        fund_codes_path, _FUNDS_CACHE_NAME, lambda: _parse_funds(fund_codes_path)
+    )
+    _funds = funds  # assigned last: a non-None _funds marks the load complete
+
+    return _funds, _funds_by_issuer
+
+
+def _parse_funds(path: str) -> tuple[dict, dict, list]:
+    """Parse FundcodeDlInfo.csv into (funds, funds_by_issuer, fund_names_lower)."""
+    funds = {}
+    by_issuer = defaultdict(list)
 
     # Read fund CSV
     # Columns: 0=Fund Code, 1=Securities Code, 2=Fund Name, 3=Name Phonetic,
     #          4=Type, 5=Closing Date 1, 6=Closing Date 2, 7=EDINET Code, 8=Issuer Name
-    with open(classifier.fund_codes_path, 'r', encoding='cp932', errors='replace') as f:
+    # Only these 9 columns are read; each is stripped once, in one map() pass.
+    with open(path, 'r', encoding='cp932', errors='replace', newline='') as f:
         reader = csv.reader(f)
         next(reader)  # Skip metadata row
         next(reader)  # Skip header row
         for row in reader:
             if len(row) >= 9:
-                fund_code = row[0].strip()
+                (fund_code, securities_code, name, name_phonetic, fund_type,
+                 accounting_date_1, accounting_date_2, issuer_code, issuer_name) = map(str.strip, row[:9])
                 if fund_code:
-                    fund_data = {
-                        'fund_code': fund_code,
-                        'securities_code': row[1].strip() or None,
-                        'name': row[2].strip(),
-                        'name_phonetic': row[3].strip() or None,
-                        'fund_type': row[4].strip() or None,
-                        'accounting_date_1': row[5].strip() or None,
-                        'accounting_date_2': row[6].strip() or None,
-                        'issuer_edinet_code': row[7].strip(),
-                        'issuer_name': row[8].strip(),
-                    }
-                    _funds[fund_code] = fund_data
+                    funds[fund_code] = _FundRecord(
+                        fund_code,
+                        securities_code or None,
+                        name,
+                        name_phonetic or None,
+                        fund_type or None,
+                        accounting_date_1 or None,
+                        accounting_date_2 or None,
+                        issuer_code,
+                        issuer_name,
+                    )
 
                     # Index by issuer
-                    issuer_code = fund_data['issuer_edinet_code']
                     if issuer_code:
-                        if issuer_code not in _funds_by_issuer:
-                            _funds_by_issuer[issuer_code] = []
-                        _funds_by_issuer[issuer_code].append(fund_code)
+                        by_issuer[issuer_code].append(fund_code)
 
-    return _funds, _funds_by_issuer
+    # Lowercase names once for fund() name search
+    names_lower = [(code, record.name.lower()) for code, record in funds.items()]
+
+    # Plain dict, so lookups for unknown issuers don't insert empty lists
+    return funds, dict(by_issuer), names_lower
 
 
 class Fund:
@@ -487,6 +615,8 @@ class Fund:
     Provides access to fund metadata and issuer information.
     """
 
+    __slots__ = ('_data',)
+
     def __init__(self, data: dict[str, Any]):
         self._data = data
 
@@ -549,13 +679,13 @@ def fund(identifier: str) -> Fund | None:
 
     # Try exact fund code lookup first
     if identifier in funds:
-        return Fund(funds[identifier])
+        return Fund(funds[identifier]._asdict())
 
     # Try name search
     identifier_lower = identifier.lower()
-    for fund_code, fund_data in funds.items():
-        if identifier_lower in fund_data.get('name', '').lower():
-            return Fund(fund_data)
+    for fund_code, name_lower in _fund_names_lower:
+        if identifier_lower in name_lower:
+            return Fund(funds[fund_code]._asdict())
 
     return None
 
@@ -572,4 +702,4 @@ def funds_by_issuer(edinet_code: str) -> list[Fund]:
     """
     funds, by_issuer = _load_funds()
     fund_codes = by_issuer.get(edinet_code, [])
-    return [Fund(funds[fc]) for fc in fund_codes]
+    return [Fund(funds[fc]._asdict()) for fc in fund_codes]
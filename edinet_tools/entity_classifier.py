@@ -15,10 +15,27 @@ by header name (trying both language variants) so it works against either
 variant and fails loudly if a column is ever renamed.
 """
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
+from typing import Iterable, NamedTuple
 import csv
 import re
-import glob
+import os
+
+from . import _disk_cache
+
+
+# On-disk cache entries for the parsed CSVs; bump a suffix whenever the
+# shape of the corresponding _parse_* result changes.
+_FUND_CODES_CACHE_NAME = 'fund-codes-v2'
+_EDINET_CODES_CACHE_NAME = 'edinet-codes-v3'
+
+# The CSVs are read start to finish in one pass; a 1 MiB buffer instead of
+# the default 8 KiB cuts the number of read() calls by two orders of magnitude.
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Download date embedded in FSA file names, e.g. EdinetcodeDlInfo_20251205.csv
+_DATE_RE = re.compile(r'_(\d{8})\.csv$')
 
 
 # --- CSV schema resolution ---------------------------------------------------
@@ -141,6 +158,25 @@ class EntityType(Enum):
     UNKNOWN = "unknown"
 
 
+class _EntityRecord(NamedTuple):
+    """One row of EdinetcodeDlInfo.csv, as stored in _edinet_entities."""
+    submitter_type: str
+    is_listed: bool
+    name_jp: str | None
+    name_en: str | None
+    name_phonetic: str | None
+    # Industry values may be Japanese or English depending on CSV variant.
+    # `industry` is normalized to English for stable downstream behavior
+    # (backward compatible with the 0.5.0 shape); the raw value is kept too.
+    industry: str | None
+    industry_jp: str | None
+    securities_code: str | None
+    ticker: str | None              # 4-digit form of securities_code
+    corporate_number: str | None
+    normalized: str                 # primary, for the substring-scan fallback
+    normalized_en: str              # fallback for EN-only queries
+
+
 class EntityClassifier:
     """
     Classify EDINET entities using official FSA data.
@@ -184,41 +220,78 @@ class EntityClassifier:
     def _find_latest_file(self, prefix: str) -> str | None:
         """Find the latest dated file matching prefix in data directory."""
         data_dir = Path(__file__).parent / 'data'
-        pattern = str(data_dir / f'{prefix}*.csv')
-        matches = glob.glob(pattern)
-
-        if not matches:
-            return None
-
-        # Sort by filename (dated files will sort chronologically)
-        matches.sort(reverse=True)
-        return matches[0]
+        # Highest filename wins (dated files sort chronologically); one pass
+        # over the directory, no glob expansion or full sort.
+        with os.scandir(data_dir) as it:
+            latest = max(
+                (e for e in it if e.name.startswith(prefix) and e.name.endswith('.csv')),
+                key=lambda e: e.name,
+                default=None,
+            )
+        return latest.path if latest else None
 
     def _extract_date(self, path: str) -> str:
         """Extract date from filename like 'EdinetcodeDlInfo_20251205.csv'."""
-        match = re.search(r'_(\d{8})\.csv$', str(path))
+        match = _DATE_RE.search(str(path))
         if match:
             d = match.group(1)
             return f"{d[:4]}-{d[4:6]}-{d[6:8]}"
         return "unknown"
 
     def _load_data(self):
-        """Load and index both CSV files."""
-        from .normalize import normalize_for_matching
+        """
+        Load the fund registry, reusing the on-disk cache when fresh.
+
+        The much larger EDINET registry is loaded on first use (see
+        _edinet_index), so callers that only ask is_fund() never pay for it.
+        """
+        # Parsing is a one-off per CSV version; later processes unpickle the
+        # finished indexes instead (see _disk_cache)
+        self._fund_edinet_codes = _disk_cache.load_or_build(
+            self.fund_codes_path, _FUND_CODES_CACHE_NAME, self._parse_fund_codes
+        )
 
-        self._fund_edinet_codes = set()
-        self._edinet_entities = {}  # edinet_code -> entity info
+    @cached_property
+    def _edinet_index(self) -> tuple[dict, dict, dict, dict]:
+        return _disk_cache.load_or_build(
+            self.edinet_codes_path, _EDINET_CODES_CACHE_NAME, self._parse_edinet_codes
+        )
 
-        # Reverse indexes for O(1) lookups (v0.6.0)
-        self._by_normalized_name = {}      # normalized name -> list[edinet_code]
-        self._by_securities_code = {}      # securities_code -> edinet_code
-        self._by_corporate_number = {}     # 法人番号 -> edinet_code
+    @cached_property
+    def _edinet_entities(self) -> dict:
+        return self._edinet_index[0]
+
+    @cached_property
+    def _by_normalized_name(self) -> dict:
+        return self._edinet_index[1]
+
+    @cached_property
+    def _by_securities_code(self) -> dict:
+        return self._edinet_index[2]
+
+    @cached_property
+    def _by_corporate_number(self) -> dict:
+        return self._edinet_index[3]
+
+    @cached_property
+    def _entity_types(self) -> dict:
+        # The registries are fixed once loaded, so classify every known code
+        # at once; get_entity_type() is then a single dict lookup.
+        return {
+            code: self._classify(code)
+            for code in (*self._edinet_entities, *self._fund_edinet_codes)
+        }
+
+    def _parse_fund_codes(self) -> frozenset:
+        """Parse FundcodeDlInfo.csv into the set of fund issuer EDINET codes."""
+        fund_edinet_codes = set()
 
         # Load fund codes (Shift-JIS encoded). We only need the issuer's
         # EDINET code from this file, but we still resolve it by header so
         # that a schema change surfaces immediately instead of silently
         # indexing the wrong column.
-        with open(self.fund_codes_path, 'r', encoding='cp932', errors='replace') as f:
+        with open(self.fund_codes_path, 'r', encoding='cp932', errors='replace',
+                  buffering=_CSV_BUFFER_SIZE) as f:
             reader = csv.reader(f)
             next(reader, None)  # metadata row (download date, count)
             header = next(reader, None)
@@ -231,11 +304,32 @@ class EntityClassifier:
                     continue
                 edinet_code = row[idx_edinet].strip()
                 if edinet_code.startswith('E'):
-                    self._fund_edinet_codes.add(edinet_code)
+                    fund_edinet_codes.add(edinet_code)
+
+        # Read-only from here on, like the rest of the loaded registries
+        return frozenset(fund_edinet_codes)
+
+    def _parse_edinet_codes(self) -> tuple[dict, dict, dict, dict]:
+        """
+        Parse EdinetcodeDlInfo.csv into the entity table and reverse indexes.
+
+        Returns:
+            (edinet_entities, by_normalized_name, by_securities_code,
+            by_corporate_number)
+        """
+        from .normalize import normalize_for_matching
+
+        edinet_entities = {}  # edinet_code -> entity info
+
+        # Reverse indexes for O(1) lookups (v0.6.0)
+        by_normalized_name = {}      # normalized name -> list[edinet_code]
+        by_securities_code = {}      # securities_code -> edinet_code
+        by_corporate_number = {}     # 法人番号 -> edinet_code
 
         # Load EDINET codes (Shift-JIS encoded). Resolve every column by
         # header alias so the loader handles both EN and JP CSV variants.
-        with open(self.edinet_codes_path, 'r', encoding='cp932', errors='replace') as f:
+        with open(self.edinet_codes_path, 'r', encoding='cp932', errors='replace',
+                  buffering=_CSV_BUFFER_SIZE) as f:
             reader = csv.reader(f)
             next(reader, None)  # metadata row
             header = next(reader, None)
@@ -243,6 +337,9 @@ class EntityClassifier:
                 raise ValueError(f"Empty EDINET codes file: {self.edinet_codes_path}")
             col = _resolve_columns(header, _EDINET_COLUMN_ALIASES)
             max_idx = max(col.values())
+            # Submitter type and industry take only a few dozen distinct
+            # values: keep one str object per value instead of one per row.
+            shared = {}.setdefault
             for row in reader:
                 if len(row) <= max_idx:
                     continue
@@ -254,31 +351,35 @@ class EntityClassifier:
                 name_en = row[col["name_en"]].strip() or None
                 name_phonetic = row[col["name_phonetic"]].strip() or None
                 securities_code = row[col["securities_code"]].strip() or None
+                # Convert 5-digit (12340) to 4-digit (1234) once, here, rather
+                # than on every get_securities_code() call
+                ticker = securities_code
+                if ticker and len(ticker) == 5 and ticker.endswith('0'):
+                    ticker = ticker[:4]
                 corporate_number = row[col["corporate_number"]].strip() or None
                 industry_raw = row[col["industry"]].strip() or None
+                industry_raw = shared(industry_raw, industry_raw)
+                submitter_type = row[col["submitter_type"]].strip()
+                submitter_type = shared(submitter_type, submitter_type)
 
                 # Pre-compute normalized forms for substring-scan fallback
                 normalized_jp = normalize_for_matching(name_jp)
                 normalized_en = normalize_for_matching(name_en)
 
-                self._edinet_entities[edinet_code] = {
-                    'submitter_type': row[col["submitter_type"]].strip(),
-                    'is_listed': row[col["listed"]].strip() in _LISTED_VALUES,
-                    'name_jp': name_jp,
-                    'name_en': name_en,
-                    'name_phonetic': name_phonetic,
-                    # Industry values may be Japanese or English depending
-                    # on CSV variant. Normalize `industry` to English for
-                    # stable downstream behavior (backward compatible with
-                    # the 0.5.0 shape) and preserve the raw Japanese value
-                    # separately.
-                    'industry': translate_industry_to_english(industry_raw),
-                    'industry_jp': industry_raw,
-                    'securities_code': securities_code,
-                    'corporate_number': corporate_number,
-                    '_normalized': normalized_jp,    # primary
-                    '_normalized_en': normalized_en, # fallback for EN-only queries
-                }
+                edinet_entities[edinet_code] = _EntityRecord(
+                    submitter_type,
+                    row[col["listed"]].strip() in _LISTED_VALUES,
+                    name_jp,
+                    name_en,
+                    name_phonetic,
+                    translate_industry_to_english(industry_raw),
+                    industry_raw,
+                    securities_code,
+                    ticker,
+                    corporate_number,
+                    normalized_jp,
+                    normalized_en,
+                )
 
                 # Build reverse indexes — index each name under BOTH its
                 # whitespace-preserved form and its whitespace-collapsed form.
@@ -290,18 +391,20 @@ class EntityClassifier:
                     if not n or n in seen_keys:
                         continue
                     seen_keys.add(n)
-                    self._by_normalized_name.setdefault(n, []).append(edinet_code)
+                    by_normalized_name.setdefault(n, []).append(edinet_code)
                     n_nows = ''.join(n.split())  # whitespace-collapsed form
                     if n_nows and n_nows != n and n_nows not in seen_keys:
                         seen_keys.add(n_nows)
-                        self._by_normalized_name.setdefault(n_nows, []).append(edinet_code)
+                        by_normalized_name.setdefault(n_nows, []).append(edinet_code)
                 if securities_code:
-                    self._by_securities_code[securities_code] = edinet_code
+                    by_securities_code[securities_code] = edinet_code
                     # Also index the 4-digit form (strip trailing 0 for 5-digit-ending-in-0 codes)
-                    if len(securities_code) == 5 and securities_code.endswith('0'):
-                        self._by_securities_code[securities_code[:4]] = edinet_code
+                    if ticker != securities_code:
+                        by_securities_code[ticker] = edinet_code
                 if corporate_number:
-                    self._by_corporate_number[corporate_number] = edinet_code
+                    by_corporate_number[corporate_number] = edinet_code
+
+        return edinet_entities, by_normalized_name, by_securities_code, by_corporate_number
 
     def get_entity_type(self, edinet_code: str) -> EntityType:
         """
@@ -322,12 +425,32 @@ class EntityClassifier:
         """
         if not edinet_code:
             return EntityType.UNKNOWN
+        return self._entity_types.get(edinet_code, EntityType.UNKNOWN)
+
+    def get_entity_types(self, edinet_codes: Iterable[str]) -> list[EntityType]:
+        """
+        Classify many EDINET codes at once.
+
+        Equivalent to calling get_entity_type() on each code, without the
+        per-call method overhead; several times faster for large batches.
+
+        Args:
+            edinet_codes: EDINET codes (e.g., ['E02144', 'E03041'])
 
+        Returns:
+            EntityType for each code, in input order
+        """
+        get = self._entity_types.get
+        unknown = EntityType.UNKNOWN
+        return [get(code, unknown) for code in edinet_codes]
+
+    def _classify(self, edinet_code: str) -> EntityType:
+        """Classify one code from the loaded registries (see get_entity_type)."""
         entity = self._edinet_entities.get(edinet_code)
 
         # Listed status from the EDINET registry wins, even if the entity
         # also appears in the fund registry.
-        if entity and entity['is_listed']:
+        if entity and entity.is_listed:
             return EntityType.LISTED_COMPANY
 
         # Fund registry takes precedence over unlisted classification.
@@ -339,7 +462,7 @@ class EntityClassifier:
 
         # Check submitter type for individuals
         # Japanese: '個人' means individual
-        if '個人' in entity['submitter_type']:
+        if '個人' in entity.submitter_type:
             return EntityType.INDIVIDUAL
 
         return EntityType.UNLISTED_COMPANY
@@ -351,7 +474,7 @@ class EntityClassifier:
     def is_listed(self, edinet_code: str) -> bool:
         """Check if entity is a listed company."""
         entity = self._edinet_entities.get(edinet_code)
-        return entity is not None and entity.get('is_listed', False)
+        return entity is not None and entity.is_listed
 
     def is_known(self, edinet_code: str) -> bool:
         """
@@ -361,7 +484,7 @@ class EntityClassifier:
         - Stale reference data (need to update CSVs)
         - Invalid EDINET code
         """
-        return edinet_code in self._edinet_entities or edinet_code in self._fund_edinet_codes
+        return edinet_code in self._entity_types
 
     def get_securities_code(self, edinet_code: str) -> str | None:
         """
@@ -374,13 +497,7 @@ class EntityClassifier:
             4-digit securities code (e.g., '7203' for Toyota) or None
         """
         entity = self._edinet_entities.get(edinet_code)
-        if entity and entity.get('securities_code'):
-            code = entity['securities_code']
-            # Convert 5-digit (12340) to 4-digit (1234)
-            if len(code) == 5 and code.endswith('0'):
-                return code[:4]
-            return code if code else None
-        return None
+        return entity.ticker if entity else None
 
     def get_entity_name(self, edinet_code: str, prefer_english: bool = True) -> str | None:
         """
@@ -397,9 +514,9 @@ class EntityClassifier:
         if not entity:
             return None
 
-        if prefer_english and entity.get('name_en'):
-            return entity['name_en']
-        return entity.get('name_jp')
+        if prefer_english and entity.name_en:
+            return entity.name_en
+        return entity.name_jp
 
     @property
     def data_version(self) -> dict:
@@ -409,10 +526,15 @@ class EntityClassifier:
             'fund_codes': self.fund_codes_date
         }
 
+    @cached_property
+    def _listed_count(self) -> int:
+        # Counting walks every entity; the registries never change after load
+        return sum(1 for e in self._edinet_entities.values() if e.is_listed)
+
     @property
     def stats(self) -> dict:
         """Return statistics about loaded data."""
-        listed = sum(1 for e in self._edinet_entities.values() if e['is_listed'])
+        listed = self._listed_count
         return {
             'total_entities': len(self._edinet_entities),
             'listed_companies': listed,
@@ -9,14 +9,61 @@ Also extracts narrative text blocks containing business policy, strategy, and ta
 import csv
 import logging
 import re
-from typing import Dict, Optional, Any, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, Optional, Any, List, Tuple, Union
+from dataclasses import dataclass, field
 import os
 
-logger = logging.getLogger(__name__)
+from ._encoding import SAMPLE_SIZE, candidate_encodings
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Characters removed from CSV cells (see _clean_cell). Regex substitution is
+# C code throughout, unlike str.translate() with a dict table, which looks
+# up every character of the cell (long text blocks included) in the dict
+_NUL_BOM_RE = re.compile('[\x00\ufeff]')
+_CONTROL_CHARS_RE = re.compile('[\x00-\x08\x0b-\x1f]')  # keep \t, \n
+
+
+def _clean_cell(col: str) -> str:
+    """Strip whitespace, quotes, NULs, BOMs and control characters (but not tabs or newlines) from a CSV cell."""
+    if not col:
+        return ''
+    # Remove null bytes and BOMs, then quotes, then the other control
+    # characters that might appear
+    cleaned = _NUL_BOM_RE.sub('', col.strip())
+    cleaned = cleaned.strip('"').strip("'").strip()
+    return _CONTROL_CHARS_RE.sub('', cleaned)
+
+
+# Numeric cell values, after commas are removed (see _parse_csv_row)
+_NUMERIC_VALUE_RE = re.compile(r'[\d.-]+\Z')
+# Scale units in the 単位 column, checked in this order
+_SCALE_FACTORS = (('千', 1000), ('百万', 1000000), ('十億', 1000000000))
+
+# Medium-Term Plan (MTP) keywords searched for by extract_mtp_targets(),
+# compiled once rather than per text block per call
+_MTP_KEYWORD_PATTERNS = tuple(re.compile(keyword, re.IGNORECASE) for keyword in (
+    r'中期経営計画',  # Medium-term management plan
+    r'中期.*計画',    # Medium-term plan (variations)
+    r'営業利益.*目標', # Operating profit target
+    r'目標.*営業利益', # Target operating profit
+    r'20\d{2}年.*目標', # Year target (2025, 2027, etc.)
+    r'\d+億円.*目標',  # Billion yen target
+    r'FY20\d{2}',     # Fiscal year
+))
+
+# Pattern: operating profit + number + billion yen
+_OPERATING_PROFIT_TARGET_RE = re.compile(r'営業利益[^\d]*?(\d+(?:,\d+)*)\s*億円')
+# Pattern: fiscal year
+_FISCAL_YEAR_RE = re.compile(r'(?:FY)?20(\d{2})年?')
+
+
+def _compile_keywords(keywords: List[Union[str, re.Pattern]]) -> List[re.Pattern]:
+    """Compile keyword strings case-insensitively; already-compiled patterns pass through."""
+    return [k if isinstance(k, re.Pattern) else re.compile(k, re.IGNORECASE) for k in keywords]
+
+
+@dataclass(frozen=True, slots=True)
 class FinancialMetric:
     """Represents a single financial metric with context."""
     element_name: str
@@ -27,62 +74,70 @@ class FinancialMetric:
     currency: str
     scale: str
     value: Optional[float]
-    
+    # Period classification, set once in __post_init__ (see _period_flags).
+    # Frozen, so the fields it is derived from cannot change under it
+    _is_current: bool = field(init=False, repr=False, compare=False)
+    _is_prior: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        is_current, is_prior = self._period_flags()
+        object.__setattr__(self, '_is_current', is_current)
+        object.__setattr__(self, '_is_prior', is_prior)
+
+    def _period_flags(self) -> Tuple[bool, bool]:
+        """(is current, is prior), classified from the lowercased period and context."""
+        period = self.period_description.lower()
+        context = self.context.lower()
+
+        # Current period: 'current' in the period (CurrentYTDDuration,
+        # CurrentDuration, CurrentInstant, ...), 'current' in the context of
+        # an instant value, or no period at all unless the context says prior
+        is_current = (
+            'current' in period
+            or ('current' in context and 'duration' not in period)
+            or (period == '' and 'prior' not in context)
+        )
+        # Prior period: Prior1YTDDuration, PriorDuration, PriorInstant, ...
+        is_prior = 'prior' in period or 'prior' in context
+        return is_current, is_prior
+
     @property
     def is_current_period(self) -> bool:
         """Check if this metric is for the current period."""
-        period = self.period_description.lower()
-        context = self.context.lower()
-        
-        # Check for various current period indicators
-        current_indicators = [
-            'current' in period,
-            'currentytdduration' in period,
-            'currentduration' in period,
-            'currentinstant' in period,
-            'current' in context and 'duration' not in period,  # Instant values
-            period == '' and 'prior' not in context  # Default to current if ambiguous
-        ]
-        return any(current_indicators)
-    
+        return self._is_current
+
     @property
     def is_prior_period(self) -> bool:
         """Check if this metric is for the prior period."""
-        period = self.period_description.lower()
-        context = self.context.lower()
-        
-        # Check for various prior period indicators
-        prior_indicators = [
-            'prior' in period,
-            'prior1ytdduration' in period,
-            'priorduration' in period,
-            'priorinstant' in period,
-            'prior' in context
-        ]
-        return any(prior_indicators)
-
-
-@dataclass
+        return self._is_prior
+
+
+@dataclass(frozen=True, slots=True)
 class TextBlock:
     """Represents a narrative text block from EDINET filings."""
     element_name: str
     japanese_label: str
     text_content: str
+    content_length: int = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'content_length', len(self.text_content))
 
-    def search(self, keywords: List[str], context_chars: int = 200) -> List[Tuple[str, str]]:
+    def search(self, keywords: List[Union[str, re.Pattern]], context_chars: int = 200) -> List[Tuple[str, str]]:
         """
         Search for keywords in this text block.
 
         Args:
-            keywords: List of keywords/patterns to search for
+            keywords: List of keywords/patterns to search for. Strings are
+                matched case-insensitively; compiled patterns are used as-is.
             context_chars: Number of characters of context to return around matches
 
         Returns:
             List of (keyword, context_snippet) tuples
         """
         matches = []
-        for keyword in keywords:
-            pattern = re.compile(keyword, re.IGNORECASE)
+        for pattern in _compile_keywords(keywords):
+            keyword = pattern.pattern
             for match in pattern.finditer(self.text_content):
                 start = max(0, match.start() - context_chars)
                 end = min(len(self.text_content), match.end() + context_chars)
@@ -143,7 +198,11 @@ class EdinetXbrlCsvParser:
         'roe': 'jpcrp_cor:RateOfReturnOnEquitySummaryOfBusinessResults',
         'roa': 'jpcrp_cor:RateOfReturnOnAssetsSummaryOfBusinessResults',
     }
-    
+
+    # Reverse lookups, built once: every CSV row is checked against these
+    _METRIC_KEY_BY_ELEMENT = {element: key for key, element in FINANCIAL_METRICS.items()}
+    _TEXT_BLOCK_KEY_BY_ELEMENT = {element: key for key, element in NARRATIVE_TEXT_BLOCKS.items()}
+
     def __init__(self):
         self.metrics: List[FinancialMetric] = []
         self.text_blocks: List[TextBlock] = []
@@ -178,93 +237,89 @@ class EdinetXbrlCsvParser:
     
     def _parse_single_csv_file(self, csv_file: str, extract_text_blocks: bool = True) -> None:
         """Parse a single XBRL CSV file."""
-        logger.debug(f"Parsing XBRL CSV file: {csv_file}")
-        # Try multiple encodings for robust parsing
-        encodings = ['utf-16le', 'utf-16', 'utf-8', 'shift-jis', 'euc-jp']
-        content = None
-        
-        for encoding in encodings:
-            try:
-                with open(csv_file, 'r', encoding=encoding, errors='ignore') as f:
-                    content = f.read()
-                    # Remove BOM if present
-                    if content.startswith('\ufeff'):
-                        content = content[1:]
-                    if content.startswith('��'):
-                        content = content[1:]
-                    break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-        
-        if not content:
-            logger.error(f"Could not read XBRL CSV file with any encoding: {csv_file}")
-            return
-        
         try:
-            # Parse CSV content
-            lines = content.strip().split('\n')
-            reader = csv.reader(lines, delimiter='\t')
-            
-            total_rows = 0
-            parsed_rows = 0
-            relevant_rows = 0
-            
-            for row_num, row in enumerate(reader, 1):
-                total_rows += 1
-                if len(row) >= 9:  # Ensure we have all required columns (updated from 11 to 9)
-                    try:
-                        if total_rows <= 3:  # Show raw data for first few rows
-                            logger.debug(f"Raw row {row_num}: {[col[:50] for col in row[:3]]}")  # Truncate long values
-                        # Check if this is a text block BEFORE parsing as metric
-                        element_name = row[0].strip() if len(row) > 0 else ""
-                        if extract_text_blocks and self._is_text_block(element_name):
-                            # Extract text blocks directly from raw row
-                            text_content = row[8].strip() if len(row) > 8 else ""
-                            if text_content and len(text_content) > 50:
-                                text_block = TextBlock(
-                                    element_name=element_name,
-                                    japanese_label=row[1].strip() if len(row) > 1 else "",
-                                    text_content=text_content
-                                )
-                                self.text_blocks.append(text_block)
-                                parsed_rows += 1
-                        else:
-                            # Parse as financial metric
-                            metric = self._parse_csv_row(row, total_rows)
-                            if metric:
-                                parsed_rows += 1
-                                if self._is_relevant_metric(metric.element_name):
-                                    relevant_rows += 1
-                                    self.metrics.append(metric)
-                                elif total_rows <= 10 and metric.element_name:  # Show more examples for debugging
-                                    logger.debug(f"Non-relevant element: '{metric.element_name[:100]}'")
-                    except Exception as e:
-                        logger.debug(f"Error parsing row {row_num} in {csv_file}: {e}")
-                        continue
-                        
-            logger.debug(f"Processed {total_rows} rows, parsed {parsed_rows}, found {relevant_rows} relevant metrics")
+            with open(csv_file, 'rb') as f:
+                encodings = candidate_encodings(f.read(SAMPLE_SIZE))
+            # Decode strictly: the likeliest encoding only fits the first few
+            # KB, and a Shift-JIS file that starts with ASCII also passes as
+            # UTF-8. On a decode error, drop the rows read so far and retry
+            # with the next candidate; read lossily only if none decode.
+            candidates = [(e, 'strict') for e in encodings]
+            candidates.append((encodings[0], 'replace'))
+            metrics_count, text_blocks_count = len(self.metrics), len(self.text_blocks)
+            for encoding, errors in candidates:
+                logger.debug(f"Reading {csv_file} as {encoding}")
+                try:
+                    # newline='' as csv requires: quoted cells keep their \r\n
+                    with open(csv_file, 'r', encoding=encoding, errors=errors, newline='') as f:
+                        total_rows = self._parse_csv_rows(f, csv_file, extract_text_blocks)
+                    break
+                except UnicodeDecodeError as e:
+                    logger.debug(f"{csv_file} is not {encoding}: {e}")
+                    del self.metrics[metrics_count:]
+                    del self.text_blocks[text_blocks_count:]
+
+            if not total_rows:
+                logger.error(f"Could not read any rows from XBRL CSV file: {csv_file}")
+                return
                             
         except Exception as e:
             logger.error(f"Error reading XBRL CSV file {csv_file}: {e}")
+
+    def _parse_csv_rows(self, f, csv_file: str, extract_text_blocks: bool) -> int:
+        """Parse the rows of an open XBRL CSV file; returns the number of rows read."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Parse rows as they are read, rather than holding the whole file and
+        # a list of its lines in memory at once
+        reader = csv.reader(f, delimiter='\t')
+
+        total_rows = 0
+        parsed_rows = 0
+        relevant_rows = 0
+
+        for row_num, row in enumerate(reader, 1):
+            total_rows += 1
+            if len(row) >= 9:  # Ensure we have all required columns (updated from 11 to 9)
+                try:
+                    if total_rows <= 3 and debug:  # Show raw data for first few rows
+                        logger.debug(f"Raw row {row_num}: {[col[:50] for col in row[:3]]}")  # Truncate long values
+                    # Check if this is a text block BEFORE parsing as metric
+                    element_name = row[0].strip() if len(row) > 0 else ""
+                    if extract_text_blocks and self._is_text_block(element_name):
+                        # Extract text blocks directly from raw row
+                        text_content = row[8].strip() if len(row) > 8 else ""
+                        if text_content and len(text_content) > 50:
+                            text_block = TextBlock(
+                                element_name=element_name,
+                                japanese_label=row[1].strip() if len(row) > 1 else "",
+                                text_content=text_content
+                            )
+                            self.text_blocks.append(text_block)
+                            parsed_rows += 1
+                    elif not self._is_relevant_metric(_clean_cell(row[0])):
+                        # Most rows are elements we don't track: skip
+                        # them before cleaning and parsing every column
+                        if total_rows <= 10 and debug and element_name:  # Show more examples for debugging
+                            logger.debug(f"Non-relevant element: '{element_name[:100]}'")
+                    else:
+                        # Parse as financial metric
+                        metric = self._parse_csv_row(row, total_rows)
+                        if metric:
+                            parsed_rows += 1
+                            relevant_rows += 1
+                            self.metrics.append(metric)
+                except Exception as e:
+                    logger.debug(f"Error parsing row {row_num} in {csv_file}: {e}")
+                    continue
+
+        logger.debug(f"Processed {total_rows} rows, parsed {parsed_rows}, found {relevant_rows} relevant metrics")
+        return total_rows
     
     def _parse_csv_row(self, row: List[str], total_rows: int = 0) -> Optional[FinancialMetric]:
         """Parse a single CSV row into a FinancialMetric."""
         try:
             # Clean up quoted values and handle encoding issues
-            cleaned_row = []
-            for i, col in enumerate(row):
-                if not col:
-                    cleaned_row.append('')
-                    continue
-                    
-                cleaned = col.strip()
-                # Remove null bytes, control characters, and quotes
-                cleaned = cleaned.replace('\x00', '').replace('\ufeff', '')
-                # Remove various quote types and control characters
-                cleaned = cleaned.strip('"').strip("'").strip()
-                # Remove other control characters that might appear
-                cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in ['\t', '\n'])
-                cleaned_row.append(cleaned)
+            cleaned_row = [_clean_cell(col) for col in row]
             
             # CSV structure: "要素ID", "項目名", "コンテキストID", "相対年度", "連結・個別", "期間・時点", "ユニットID", "単位", "値"
             element_name = cleaned_row[0]           # 要素ID
@@ -278,7 +333,7 @@ class EdinetXbrlCsvParser:
             value_str = cleaned_row[8]              # 値
             
             # Debug: show cleaned values for first few relevant rows
-            if total_rows <= 50 and self._is_relevant_metric(element_name) and len([m for m in self.metrics if self._is_relevant_metric(m.element_name)]) == 0:
+            if total_rows <= 50 and not self.metrics and self._is_relevant_metric(element_name):
                 logger.debug(f"First relevant metric found:")
                 logger.debug(f"  Element: '{element_name}'")
                 logger.debug(f"  Context: '{context}'")
@@ -290,17 +345,16 @@ class EdinetXbrlCsvParser:
                 try:
                     # Remove commas and handle negative values
                     clean_value = value_str.replace(',', '').strip()
-                    if clean_value and (clean_value.replace('-', '').replace('.', '').isdigit() or 
-                                      clean_value.count('.') == 1 and clean_value.replace('-', '').replace('.', '').isdigit()):
+                    # Digits, '.' and '-' only: float() alone would also take
+                    # 'nan', 'inf', '1e5' and '1_000'
+                    if _NUMERIC_VALUE_RE.match(clean_value):
                         value = float(clean_value)
                         # Convert based on scale information
                         if unit_scale:
-                            if '千円' in unit_scale or '千' in unit_scale:
-                                value = value * 1000
-                            elif '百万円' in unit_scale or '百万' in unit_scale:
-                                value = value * 1000000
-                            elif '十億円' in unit_scale or '十億' in unit_scale:
-                                value = value * 1000000000
+                            for unit, factor in _SCALE_FACTORS:
+                                if unit in unit_scale:
+                                    value = value * factor
+                                    break
                 except (ValueError, TypeError):
                     value = None
             
@@ -321,60 +375,49 @@ class EdinetXbrlCsvParser:
     
     def _is_relevant_metric(self, element_name: str) -> bool:
         """Check if this metric is one we care about."""
-        return element_name in self.FINANCIAL_METRICS.values()
+        return element_name in self._METRIC_KEY_BY_ELEMENT
 
     def _is_text_block(self, element_name: str) -> bool:
         """Check if this is a narrative text block we want to extract."""
-        return element_name in self.NARRATIVE_TEXT_BLOCKS.values() or 'TextBlock' in element_name
+        # Text block element ids end in their type suffix, which also covers
+        # every NARRATIVE_TEXT_BLOCKS element; the lookup is for any that don't
+        return element_name.endswith('TextBlock') or element_name in self._TEXT_BLOCK_KEY_BY_ELEMENT
+
+    def _text_block_key(self, element_name: str) -> str:
+        """Output key for a text block: its NARRATIVE_TEXT_BLOCKS key, else the local element name."""
+        block_key = self._TEXT_BLOCK_KEY_BY_ELEMENT.get(element_name)
+        if block_key:
+            return block_key
+        return element_name.split(':')[-1] if ':' in element_name else element_name
 
     def _format_text_blocks(self) -> Dict[str, Any]:
         """Format extracted text blocks for output."""
-        result = {}
-        for block in self.text_blocks:
-            # Find the key name for this block
-            block_key = None
-            for key, element in self.NARRATIVE_TEXT_BLOCKS.items():
-                if block.element_name == element:
-                    block_key = key
-                    break
-
-            if not block_key:
-                # Use element name as fallback
-                block_key = block.element_name.split(':')[-1] if ':' in block.element_name else block.element_name
-
-            result[block_key] = {
+        return {
+            self._text_block_key(block.element_name): {
                 'label': block.japanese_label,
                 'content': block.text_content,
-                'content_length': len(block.text_content)
+                'content_length': block.content_length,
             }
+            for block in self.text_blocks
+        }
 
-        return result
-
-    def search_text_blocks(self, keywords: List[str], context_chars: int = 200) -> Dict[str, List[Tuple[str, str]]]:
+    def search_text_blocks(self, keywords: List[Union[str, re.Pattern]], context_chars: int = 200) -> Dict[str, List[Tuple[str, str]]]:
         """
         Search all text blocks for keywords.
 
         Args:
-            keywords: List of keywords/patterns to search for
+            keywords: List of keywords/patterns to search for (see TextBlock.search)
             context_chars: Number of characters of context around matches
 
         Returns:
             Dict mapping block keys to list of (keyword, context) tuples
         """
         results = {}
+        patterns = _compile_keywords(keywords)  # once, not once per block
         for block in self.text_blocks:
-            matches = block.search(keywords, context_chars)
+            matches = block.search(patterns, context_chars)
             if matches:
-                # Find block key
-                block_key = None
-                for key, element in self.NARRATIVE_TEXT_BLOCKS.items():
-                    if block.element_name == element:
-                        block_key = key
-                        break
-                if not block_key:
-                    block_key = block.element_name.split(':')[-1] if ':' in block.element_name else block.element_name
-
-                results[block_key] = matches
+                results[self._text_block_key(block.element_name)] = matches
 
         return results
     
@@ -386,31 +429,39 @@ class EdinetXbrlCsvParser:
             'metrics_count': len(self.metrics)
         }
         
-        # Group metrics by type and period
+        # Per-metric debug messages are only built when they will be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Group metrics by type and period in one pass; later rows win, as
+        # each metric may be reported more than once per period
+        current_values = {}
+        prior_values = {}
+        for metric in self.metrics:
+            metric_key = self._METRIC_KEY_BY_ELEMENT.get(metric.element_name)
+            if metric_key is None:
+                continue
+            if debug:
+                logger.debug(f"Found metric {metric_key}: element={metric.element_name}, context={metric.context}, value={metric.value}")
+            if metric.is_current_period:
+                current_values[metric_key] = metric.value
+            elif metric.is_prior_period:
+                prior_values[metric_key] = metric.value
+
+        # Store the metric data, in FINANCIAL_METRICS order
         for metric_key, element_name in self.FINANCIAL_METRICS.items():
-            current_value = None
-            prior_value = None
-            
-            # Find current and prior values for this metric
-            for metric in self.metrics:
-                if metric.element_name == element_name:
-                    logger.debug(f"Found metric {metric_key}: element={metric.element_name}, context={metric.context}, value={metric.value}")
-                    if metric.is_current_period:
-                        current_value = metric.value
-                    elif metric.is_prior_period:
-                        prior_value = metric.value
-            
-            # Store the metric data
+            current_value = current_values.get(metric_key)
+            prior_value = prior_values.get(metric_key)
             if current_value is not None or prior_value is not None:
                 result['financial_metrics'][metric_key] = {
                     'current': current_value,
                     'prior': prior_value,
                     'element_name': element_name
                 }
-                logger.debug(f"Extracted metric {metric_key}: current={current_value}, prior={prior_value}")
+                if debug:
+                    logger.debug(f"Extracted metric {metric_key}: current={current_value}, prior={prior_value}")
         
         # Debug: Show what elements we found
-        if self.metrics:
+        if debug and self.metrics:
             unique_elements = set(m.element_name for m in self.metrics)
             logger.debug(f"Found {len(unique_elements)} unique XBRL elements:")
             for element in sorted(unique_elements)[:10]:  # Show first 10
@@ -422,6 +473,17 @@ class EdinetXbrlCsvParser:
         return result
 
 
+def _find_xbrl_csvs(zip_extract_path: str) -> List[str]:
+    """Paths of the CSV files in an extraction's XBRL_TO_CSV directory, if any."""
+    xbrl_csv_dir = os.path.join(zip_extract_path, 'XBRL_TO_CSV')
+    try:
+        with os.scandir(xbrl_csv_dir) as entries:
+            return [entry.path for entry in entries if entry.name.endswith('.csv') and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        logger.debug("No XBRL_TO_CSV directory found")
+        return []
+
+
 def extract_xbrl_financial_data(zip_extract_path: str) -> Dict[str, Any]:
     """
     Extract financial metrics from XBRL CSV files in a document extraction.
@@ -432,17 +494,8 @@ def extract_xbrl_financial_data(zip_extract_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary of financial metrics or empty dict if no XBRL data
     """
-    xbrl_csv_dir = os.path.join(zip_extract_path, 'XBRL_TO_CSV')
-    
-    if not os.path.exists(xbrl_csv_dir):
-        logger.debug("No XBRL_TO_CSV directory found")
-        return {'has_xbrl_data': False}
-    
     # Find all CSV files in the XBRL directory
-    csv_files = []
-    for filename in os.listdir(xbrl_csv_dir):
-        if filename.endswith('.csv'):
-            csv_files.append(os.path.join(xbrl_csv_dir, filename))
+    csv_files = _find_xbrl_csvs(zip_extract_path)
     
     if not csv_files:
         logger.debug("No CSV files found in XBRL_TO_CSV directory")
@@ -453,7 +506,7 @@ def extract_xbrl_financial_data(zip_extract_path: str) -> Dict[str, Any]:
     return parser.parse_xbrl_csv_files(csv_files)
 
 
-def extract_mtp_targets(zip_extract_path: str) -> Dict[str, Any]:
+def extract_mtp_targets(zip_extract_path: str, parser: Optional[EdinetXbrlCsvParser] = None) -> Dict[str, Any]:
     """
     Extract Medium-Term Plan (MTP) targets from EDINET Yuho text blocks.
 
@@ -462,6 +515,8 @@ def extract_mtp_targets(zip_extract_path: str) -> Dict[str, Any]:
 
     Args:
         zip_extract_path: Path to extracted ZIP contents
+        parser: A parser that has already parsed this extraction's CSVs with
+            text blocks; its text blocks are searched instead of re-reading the files
 
     Returns:
         Dictionary containing MTP targets and related information
@@ -472,39 +527,22 @@ def extract_mtp_targets(zip_extract_path: str) -> Dict[str, Any]:
         'raw_matches': []
     }
 
-    xbrl_csv_dir = os.path.join(zip_extract_path, 'XBRL_TO_CSV')
-
-    if not os.path.exists(xbrl_csv_dir):
-        return result
+    if parser is None:
+        # Find all CSV files
+        csv_files = _find_xbrl_csvs(zip_extract_path)
 
-    # Find all CSV files
-    csv_files = []
-    for filename in os.listdir(xbrl_csv_dir):
-        if filename.endswith('.csv'):
-            csv_files.append(os.path.join(xbrl_csv_dir, filename))
+        if not csv_files:
+            return result
 
-    if not csv_files:
-        return result
-
-    # Parse and extract text blocks
-    parser = EdinetXbrlCsvParser()
-    data = parser.parse_xbrl_csv_files(csv_files, extract_text_blocks=True)
+        # Parse and extract text blocks
+        parser = EdinetXbrlCsvParser()
+        parser.parse_xbrl_csv_files(csv_files, extract_text_blocks=True)
 
-    if 'text_blocks' not in data or not data['text_blocks']:
+    if not parser.text_blocks:
         return result
 
     # Search for MTP-related keywords in text blocks
-    mtp_keywords = [
-        r'中期経営計画',  # Medium-term management plan
-        r'中期.*計画',    # Medium-term plan (variations)
-        r'営業利益.*目標', # Operating profit target
-        r'目標.*営業利益', # Target operating profit
-        r'20\d{2}年.*目標', # Year target (2025, 2027, etc.)
-        r'\d+億円.*目標',  # Billion yen target
-        r'FY20\d{2}',     # Fiscal year
-    ]
-
-    matches = parser.search_text_blocks(mtp_keywords, context_chars=300)
+    matches = parser.search_text_blocks(_MTP_KEYWORD_PATTERNS, context_chars=300)
 
     if matches:
         result['has_mtp_data'] = True
@@ -513,13 +551,8 @@ def extract_mtp_targets(zip_extract_path: str) -> Dict[str, Any]:
         # Try to extract structured targets using regex patterns
         for block_key, match_list in matches.items():
             for keyword, context in match_list:
-                # Pattern: operating profit + number + billion yen
-                op_pattern = r'営業利益[^\d]*?(\d+(?:,\d+)*)\s*億円'
-                op_matches = re.findall(op_pattern, context)
-
-                # Pattern: fiscal year
-                fy_pattern = r'(?:FY)?20(\d{2})年?'
-                fy_matches = re.findall(fy_pattern, context)
+                op_matches = _OPERATING_PROFIT_TARGET_RE.findall(context)
+                fy_matches = _FISCAL_YEAR_RE.findall(context)
 
                 if op_matches or fy_matches:
                     target_entry = {
@@ -531,4 +564,30 @@ def extract_mtp_targets(zip_extract_path: str) -> Dict[str, Any]:
                     result['targets'].append(target_entry)
 
     logger.info(f"Found {len(result['targets'])} MTP target mentions")
-    return result
\ No newline at end of file
+    return result
+
+
+def extract_all(zip_extract_path: str) -> Dict[str, Any]:
+    """
+    Extract financial metrics and MTP targets, reading the XBRL CSV files once.
+
+    Equivalent to extract_xbrl_financial_data() with the result of
+    extract_mtp_targets() added under 'mtp_targets'.
+
+    Args:
+        zip_extract_path: Path to extracted ZIP contents
+
+    Returns:
+        Dictionary of financial metrics and text blocks, plus 'mtp_targets'
+    """
+    csv_files = _find_xbrl_csvs(zip_extract_path)
+    parser = EdinetXbrlCsvParser()
+
+    if csv_files:
+        result = parser.parse_xbrl_csv_files(csv_files, extract_text_blocks=True)
+    else:
+        logger.debug("No CSV files found in XBRL_TO_CSV directory")
+        result = {'has_xbrl_data': False}
+
+    result['mtp_targets'] = extract_mtp_targets(zip_extract_path, parser=parser)
+    return result
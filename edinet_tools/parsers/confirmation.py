@@ -17,6 +17,7 @@ from dataclasses import dataclass
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
 )
@@ -88,9 +89,10 @@ def parse_confirmation(document=None, *, csv_files=None, doc_id=None, doc_type_c
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     def get(key: str, context: list[str] | None = None) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=context)
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=context)
 
     filer_edinet_code = get('filer_edinet_code', ['FilingDateInstant'])
     filer_name = get('filer_name', ['FilingDateInstant'])
@@ -15,6 +15,7 @@ from typing import Optional
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
 )
@@ -96,9 +97,10 @@ def parse_exemption_application(document=None, *, csv_files=None, doc_id=None, d
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     def get(key: str, context: list[str] | None = None) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=context)
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=context)
 
     filer_edinet_code = get('filer_edinet_code', ['FilingDateInstant'])
     filer_name = get('filer_name', ['FilingDateInstant'])
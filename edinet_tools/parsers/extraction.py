@@ -11,6 +11,8 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Optional
 
+from .._encoding import SAMPLE_SIZE, candidate_encodings
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,25 +62,26 @@ def extract_csv_from_zip(zip_bytes: bytes) -> list[dict[str, Any]]:
     return csv_files
 
 
-def _read_csv_from_zip(zf: zipfile.ZipFile, name: str) -> list[dict[str, Any]]:
-    """Read a single CSV file from a ZIP archive."""
-    raw_bytes = zf.read(name)
-
-    # Try multiple encodings (EDINET uses various encodings)
-    encodings = ['utf-16le', 'utf-16', 'utf-8', 'shift-jis', 'cp932']
-    content = None
+def _decode_csv(raw_bytes: bytes) -> Optional[str]:
+    """
+    Decode a CSV file's bytes, trying the likeliest encoding first.
 
-    for encoding in encodings:
+    The remaining candidates (see _encoding.candidate_encodings) are only
+    tried if it fails. Returns None if none decode.
+    """
+    for encoding in candidate_encodings(raw_bytes[:SAMPLE_SIZE]):
         try:
-            decoded = raw_bytes.decode(encoding)
-            # Remove BOM if present
-            if decoded.startswith('\ufeff'):
-                decoded = decoded[1:]
-            content = decoded
-            break
-        except (UnicodeDecodeError, UnicodeError):
+            return raw_bytes.decode(encoding)
+        except UnicodeError:
             continue
+    return None
+
 
+def _read_csv_from_zip(zf: zipfile.ZipFile, name: str) -> list[dict[str, Any]]:
+    """Read a single CSV file from a ZIP archive."""
+    raw_bytes = zf.read(name)
+
+    content = _decode_csv(raw_bytes)
     if not content:
         logger.warning(f"Could not decode {name} with any encoding")
         return []
@@ -88,11 +91,14 @@ def _read_csv_from_zip(zf: zipfile.ZipFile, name: str) -> list[dict[str, Any]]:
     try:
         lines = content.strip().split('\n')
         reader = csv.reader(lines, delimiter='\t')
+        # Element IDs, contexts and units repeat on most rows: clean each
+        # distinct cell once per file
+        cleaned_cells = _CleanedCells()
 
         for row in reader:
             if len(row) >= 9:
                 # Clean up values
-                cleaned = [_clean_value(col) for col in row]
+                cleaned = list(map(cleaned_cells.__getitem__, row))
                 rows.append({
                     '要素ID': cleaned[0],      # element_id
                     '項目名': cleaned[1],      # japanese_label
@@ -111,6 +117,14 @@ def _read_csv_from_zip(zf: zipfile.ZipFile, name: str) -> list[dict[str, Any]]:
     return rows
 
 
+class _CleanedCells(dict):
+    """Memo of _clean_value(): maps raw cell -> cleaned cell, cleaning on first lookup."""
+
+    def __missing__(self, value: str) -> str:
+        cleaned = self[value] = _clean_value(value)
+        return cleaned
+
+
 def _clean_value(value: str) -> str:
     """Clean a CSV cell value."""
     if not value:
@@ -208,8 +222,34 @@ def parse_date(value: Any) -> Optional[date]:
     return None
 
 
+def build_element_index(csv_files: list) -> dict[str, list[tuple[str, Any]]]:
+    """
+    Index csv_files by XBRL element ID, for repeated lookups with extract_value().
+
+    Parsers look up dozens of elements per document; scanning every row of
+    every file for each one costs O(lookups x rows), the index O(rows) once.
+
+    Args:
+        csv_files: List of dicts with 'filename' and 'data' keys
+
+    Returns:
+        Dict of element_id -> list of (context_id, value), in file and row order
+    """
+    index: dict[str, list[tuple[str, Any]]] = {}
+    for csv_file in csv_files:
+        for entry in csv_file.get('data', []):
+            element_id = entry.get('要素ID')
+            occurrence = (entry.get('コンテキストID', ''), entry.get('値'))
+            occurrences = index.get(element_id)
+            if occurrences is None:
+                index[element_id] = [occurrence]
+            else:
+                occurrences.append(occurrence)
+    return index
+
+
 def extract_value(
-    csv_files: list,
+    csv_files: list | dict,
     element_id: str,
     get_last: bool = False,
     context_patterns: Optional[list[str]] = None
@@ -218,7 +258,8 @@ def extract_value(
     Extract value from csv_files by XBRL element ID.
 
     Args:
-        csv_files: List of dicts with 'filename' and 'data' keys
+        csv_files: List of dicts with 'filename' and 'data' keys, or an index
+                   of them from build_element_index() (for repeated lookups)
         element_id: XBRL element ID to search for
         get_last: If True, return last occurrence (useful for totals in joint filings)
         context_patterns: List of context IDs to try in order (e.g., ['CurrentYearDuration'])
@@ -226,30 +267,28 @@ def extract_value(
                          Uses exact matching to prevent e.g. 'CurrentYearDuration' from
                          matching 'CurrentYearDuration_NonConsolidatedMember'.
     """
+    if isinstance(csv_files, dict):
+        occurrences = csv_files.get(element_id, ())
+    else:
+        occurrences = [
+            (entry.get('コンテキストID', ''), entry.get('値'))
+            for csv_file in csv_files
+            for entry in csv_file.get('data', [])
+            if entry.get('要素ID') == element_id
+        ]
+
     # If context patterns specified, try each in priority order
     if context_patterns:
         for pattern in context_patterns:
-            for csv_file in csv_files:
-                data = csv_file.get('data', [])
-                for entry in data:
-                    if entry.get('要素ID') == element_id:
-                        context = entry.get('コンテキストID', '')
-                        if context == pattern:
-                            return entry.get('値')
+            for context, value in occurrences:
+                if context == pattern:
+                    return value
         return None
 
     # No context patterns - return first (or last) match
-    result = None
-    for csv_file in csv_files:
-        data = csv_file.get('data', [])
-        for entry in data:
-            if entry.get('要素ID') == element_id:
-                value = entry.get('値')
-                if get_last:
-                    result = value  # Keep updating to get last
-                else:
-                    return value  # Return first match
-    return result
+    if not occurrences:
+        return None
+    return occurrences[-1][1] if get_last else occurrences[0][1]
 
 
 def get_context_patterns(is_consolidated: bool, period: str) -> list[str]:
@@ -280,7 +319,7 @@ def get_context_patterns(is_consolidated: bool, period: str) -> list[str]:
 
 
 def extract_financial(
-    csv_files: list,
+    csv_files: list | dict,
     element_id: str,
     period: str,
     is_consolidated: bool,
@@ -294,7 +333,8 @@ def extract_financial(
     is provided, tries the IFRS equivalent element.
 
     Args:
-        csv_files: List of dicts with 'filename' and 'data' keys
+        csv_files: List of dicts with 'filename' and 'data' keys, or an index
+                   of them from build_element_index()
         element_id: XBRL element ID to extract (e.g., 'jppfs_cor:NetSales')
         period: Period identifier (e.g., 'CurrentYearDuration')
         is_consolidated: Whether the filer prepares consolidated statements
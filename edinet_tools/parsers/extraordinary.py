@@ -11,6 +11,7 @@ from typing import Any, Optional
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
     parse_date,
@@ -175,10 +176,11 @@ def parse_extraordinary_report(document=None, *, csv_files=None, doc_id=None, do
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     # Helper to get value
     def get(key: str, context: list[str] | None = None) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=context)
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=context)
 
     # Extract DEI elements
     edinet_code = get('edinet_code', ['FilingDateInstant'])
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from .base import ParsedReport
-from .extraction import extract_csv_from_zip, extract_value
+from .extraction import build_element_index, extract_csv_from_zip, extract_value
 
 
 # Common DEI elements found across most document types
@@ -98,10 +98,11 @@ def parse_raw(document) -> RawReport:
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     # Extract common DEI elements
     def get_dei(key: str) -> str | None:
-        return extract_value(csv_files, COMMON_DEI_ELEMENTS.get(key, ''), context_patterns=['FilingDateInstant'])
+        return extract_value(index, COMMON_DEI_ELEMENTS.get(key, ''), context_patterns=['FilingDateInstant'])
 
     edinet_code = get_dei('edinet_code')
     filer_name = get_dei('filer_name')
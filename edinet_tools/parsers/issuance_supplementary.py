@@ -16,6 +16,7 @@ from typing import Optional
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
     parse_date,
@@ -146,9 +147,10 @@ def parse_issuance_supplementary(document=None, *, csv_files=None, doc_id=None,
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     def get(key: str, context: list[str] | None = None) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=context)
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=context)
 
     # DEI elements
     filer_edinet_code = get('filer_edinet_code', ['FilingDateInstant'])
@@ -17,6 +17,7 @@ from typing import Any
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
     parse_percentage,
@@ -189,10 +190,11 @@ def parse_large_holding(document=None, *, csv_files=None, doc_id=None, doc_type_
 
     # Get source filenames
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     # Extract values using element map
     def get(key: str, last: bool = False) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), get_last=last)
+        return extract_value(index, ELEMENT_MAP.get(key, ''), get_last=last)
 
     # Filer name (try multiple element IDs)
     filer_name = get('filer_name_alt1') or get('filer_name_alt2') or getattr(document, 'filer_name', None)
@@ -16,6 +16,7 @@ from typing import Any, Optional
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
     get_context_patterns,
@@ -193,10 +194,11 @@ def parse_quarterly_report(document=None, *, csv_files=None, doc_id=None, doc_ty
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     # Helper to get DEI values
     def get_dei(key: str) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=['FilingDateInstant'])
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=['FilingDateInstant'])
 
     # Extract DEI elements
     edinet_code = get_dei('edinet_code')
@@ -212,7 +214,7 @@ def parse_quarterly_report(document=None, *, csv_files=None, doc_id=None, doc_ty
 
     # Extract period
     fiscal_year_end = parse_date(get_dei('fiscal_year_end'))
-    filing_date_str = extract_value(csv_files, ELEMENT_MAP['filing_date'])
+    filing_date_str = extract_value(index, ELEMENT_MAP['filing_date'])
     filing_date = parse_date(filing_date_str)
 
     # Derive quarter number
@@ -225,7 +227,7 @@ def parse_quarterly_report(document=None, *, csv_files=None, doc_id=None, doc_ty
         element_id = ELEMENT_MAP.get(key, '')
         if not element_id:
             return None
-        return extract_financial(csv_files, element_id, period, is_consolidated, IFRS_FALLBACK_MAP)
+        return extract_financial(index, element_id, period, is_consolidated, IFRS_FALLBACK_MAP)
 
     # Income Statement (Current YTD)
     revenue_ytd = get_fin('net_sales', 'CurrentYTDDuration')
@@ -251,7 +253,7 @@ def parse_quarterly_report(document=None, *, csv_files=None, doc_id=None, doc_ty
 
     # Per-share metrics
     patterns = get_context_patterns(is_consolidated, 'CurrentYTDDuration')
-    eps_str = extract_value(csv_files, ELEMENT_MAP['eps_basic'], context_patterns=patterns)
+    eps_str = extract_value(index, ELEMENT_MAP['eps_basic'], context_patterns=patterns)
     eps_basic = None
     if eps_str and eps_str not in ('－', '―', '-', '—'):
         try:
@@ -261,7 +263,7 @@ def parse_quarterly_report(document=None, *, csv_files=None, doc_id=None, doc_ty
 
     # Ratios
     patterns = get_context_patterns(is_consolidated, 'CurrentQuarterInstant')
-    equity_str = extract_value(csv_files, ELEMENT_MAP['equity_ratio'], context_patterns=patterns)
+    equity_str = extract_value(index, ELEMENT_MAP['equity_ratio'], context_patterns=patterns)
     equity_ratio = parse_percentage(equity_str)
 
     # Categorize all elements
@@ -17,6 +17,7 @@ from typing import Any, Optional
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
     get_context_patterns,
@@ -287,10 +288,11 @@ def parse_securities_report(document=None, *, csv_files=None, doc_id=None, doc_t
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     # Helper to get DEI values
     def get_dei(key: str) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=['FilingDateInstant'])
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=['FilingDateInstant'])
 
     # Extract DEI elements
     edinet_code = get_dei('edinet_code')
@@ -314,7 +316,7 @@ def parse_securities_report(document=None, *, csv_files=None, doc_id=None, doc_t
         element_id = ELEMENT_MAP.get(key, '')
         if not element_id:
             return None
-        return extract_financial(csv_files, element_id, period, is_consolidated, IFRS_FALLBACK_MAP)
+        return extract_financial(index, element_id, period, is_consolidated, IFRS_FALLBACK_MAP)
 
     # Try summary elements first (J-GAAP then IFRS), then fall back to FS elements
     # FS elements have their own IFRS fallback via IFRS_FALLBACK_MAP in extract_financial()
@@ -407,26 +409,26 @@ def parse_securities_report(document=None, *, csv_files=None, doc_id=None, doc_t
 
     # Per-share metrics (try J-GAAP then IFRS summary)
     patterns = get_context_patterns(is_consolidated, 'CurrentYearInstant')
-    nav_str = extract_value(csv_files, ELEMENT_MAP['net_assets_per_share'], context_patterns=patterns)
+    nav_str = extract_value(index, ELEMENT_MAP['net_assets_per_share'], context_patterns=patterns)
     net_assets_per_share = Decimal(nav_str) if nav_str else None
 
     patterns = get_context_patterns(is_consolidated, 'CurrentYearDuration')
-    eps_str = extract_value(csv_files, ELEMENT_MAP['earnings_per_share'], context_patterns=patterns)
+    eps_str = extract_value(index, ELEMENT_MAP['earnings_per_share'], context_patterns=patterns)
     if not eps_str:
-        eps_str = extract_value(csv_files, ELEMENT_MAP['earnings_per_share_ifrs'], context_patterns=patterns)
+        eps_str = extract_value(index, ELEMENT_MAP['earnings_per_share_ifrs'], context_patterns=patterns)
     earnings_per_share = Decimal(eps_str) if eps_str else None
 
     # Ratios (try J-GAAP then IFRS summary)
     patterns = get_context_patterns(is_consolidated, 'CurrentYearInstant')
-    equity_str = extract_value(csv_files, ELEMENT_MAP['equity_ratio'], context_patterns=patterns)
+    equity_str = extract_value(index, ELEMENT_MAP['equity_ratio'], context_patterns=patterns)
     if not equity_str:
-        equity_str = extract_value(csv_files, ELEMENT_MAP['equity_ratio_ifrs'], context_patterns=patterns)
+        equity_str = extract_value(index, ELEMENT_MAP['equity_ratio_ifrs'], context_patterns=patterns)
     equity_ratio = parse_percentage(equity_str)
 
     patterns = get_context_patterns(is_consolidated, 'CurrentYearDuration')
-    roe_str = extract_value(csv_files, ELEMENT_MAP['roe'], context_patterns=patterns)
+    roe_str = extract_value(index, ELEMENT_MAP['roe'], context_patterns=patterns)
     if not roe_str:
-        roe_str = extract_value(csv_files, ELEMENT_MAP['roe_ifrs'], context_patterns=patterns)
+        roe_str = extract_value(index, ELEMENT_MAP['roe_ifrs'], context_patterns=patterns)
     roe = parse_percentage(roe_str)
 
     # Employment
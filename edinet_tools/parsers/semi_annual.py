@@ -11,6 +11,7 @@ from typing import Any, Optional
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
     parse_int,
@@ -103,15 +104,15 @@ class SemiAnnualReport(ParsedReport):
         return f"SemiAnnualReport(filer='{filer}', period_end={period})"
 
 
-def _extract_financial(csv_files: list, element_id: str) -> Optional[int]:
+def _extract_financial(index: dict, element_id: str) -> Optional[int]:
     """Extract financial value with IFRS fallback."""
-    value_str = extract_value(csv_files, element_id)
+    value_str = extract_value(index, element_id)
     if value_str:
         return parse_int(value_str)
 
     ifrs_element = IFRS_FALLBACK_MAP.get(element_id)
     if ifrs_element:
-        value_str = extract_value(csv_files, ifrs_element)
+        value_str = extract_value(index, ifrs_element)
         if value_str:
             return parse_int(value_str)
 
@@ -148,10 +149,11 @@ def parse_semi_annual_report(document=None, *, csv_files=None, doc_id=None, doc_
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     # Helper to get DEI values
     def get_dei(key: str) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=['FilingDateInstant'])
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=['FilingDateInstant'])
 
     # Extract DEI elements
     edinet_code = get_dei('edinet_code')
@@ -165,14 +167,14 @@ def parse_semi_annual_report(document=None, *, csv_files=None, doc_id=None, doc_
     filing_date = parse_date(get_dei('submission_date')) or period_end
 
     # Financial data
-    total_assets = _extract_financial(csv_files, ELEMENT_MAP['assets'])
-    current_assets = _extract_financial(csv_files, ELEMENT_MAP['current_assets'])
-    total_liabilities = _extract_financial(csv_files, ELEMENT_MAP['liabilities'])
-    current_liabilities = _extract_financial(csv_files, ELEMENT_MAP['current_liabilities'])
-    net_assets = _extract_financial(csv_files, ELEMENT_MAP['net_assets'])
-    operating_income = _extract_financial(csv_files, ELEMENT_MAP['operating_income'])
-    ordinary_income = _extract_financial(csv_files, ELEMENT_MAP['ordinary_income'])
-    profit_loss = _extract_financial(csv_files, ELEMENT_MAP['profit_loss'])
+    total_assets = _extract_financial(index, ELEMENT_MAP['assets'])
+    current_assets = _extract_financial(index, ELEMENT_MAP['current_assets'])
+    total_liabilities = _extract_financial(index, ELEMENT_MAP['liabilities'])
+    current_liabilities = _extract_financial(index, ELEMENT_MAP['current_liabilities'])
+    net_assets = _extract_financial(index, ELEMENT_MAP['net_assets'])
+    operating_income = _extract_financial(index, ELEMENT_MAP['operating_income'])
+    ordinary_income = _extract_financial(index, ELEMENT_MAP['ordinary_income'])
+    profit_loss = _extract_financial(index, ELEMENT_MAP['profit_loss'])
 
     # Categorize all elements
     raw_fields, text_blocks, unmapped_fields = categorize_elements(csv_files, ELEMENT_MAP)
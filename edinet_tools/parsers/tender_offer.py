@@ -17,6 +17,7 @@ from typing import Optional
 from .base import ParsedReport
 from .extraction import (
     extract_csv_from_zip,
+    build_element_index,
     extract_value,
     categorize_elements,
     parse_date,
@@ -180,10 +181,11 @@ def parse_tender_offer(document=None, *, csv_files=None, doc_id=None, doc_type_c
         )
 
     source_files = [f['filename'] for f in csv_files]
+    index = build_element_index(csv_files)
 
     # Helper to get value
     def get(key: str, context: list[str] | None = None) -> str | None:
-        return extract_value(csv_files, ELEMENT_MAP.get(key, ''), context_patterns=context)
+        return extract_value(index, ELEMENT_MAP.get(key, ''), context_patterns=context)
 
     # Extract DEI elements with context filtering
     edinet_code = get('edinet_code', ['FilingDateInstant'])
@@ -1,4 +1,5 @@
 # utils.py
+import io
 import os
 import pandas as pd
 import re
@@ -83,18 +84,36 @@ def process_zip_file(path_to_zip_file: str, doc_id: str, doc_type_code: str) ->
     :param doc_type_code: EDINET document type code.
     :return: Structured dictionary of the document's data, or None if processing failed.
     """
+    return _process_zip(path_to_zip_file, os.path.basename(path_to_zip_file), doc_id, doc_type_code)
+
+
+def process_zip_bytes(zip_bytes: bytes, doc_id: str, doc_type_code: str) -> Optional[Dict[str, Any]]:
+    """
+    Same as process_zip_file, but for ZIP content already in memory
+    (e.g. from doc.fetch()), so it need not be written to disk first.
+
+    :param zip_bytes: Raw ZIP file bytes.
+    :param doc_id: EDINET document ID.
+    :param doc_type_code: EDINET document type code.
+    :return: Structured dictionary of the document's data, or None if processing failed.
+    """
+    return _process_zip(io.BytesIO(zip_bytes), f"{doc_id}.zip", doc_id, doc_type_code)
+
+
+def _process_zip(zip_source, zip_name: str, doc_id: str, doc_type_code: str) -> Optional[Dict[str, Any]]:
+    """Shared implementation: zip_source is a path or file object, zip_name is used in log messages."""
     raw_csv_data = []
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
-                with zipfile.ZipFile(path_to_zip_file, 'r') as zip_ref:
+                with zipfile.ZipFile(zip_source, 'r') as zip_ref:
                     zip_ref.extractall(temp_dir)
-                logger.debug(f"Extracted {os.path.basename(path_to_zip_file)} to {temp_dir}")
+                logger.debug(f"Extracted {zip_name} to {temp_dir}")
             except zipfile.BadZipFile as e:
-                logger.error(f"Bad ZIP file: {path_to_zip_file}. Error: {e}")
+                logger.error(f"Bad ZIP file: {zip_name}. Error: {e}")
                 return None
             except Exception as e:
-                logger.error(f"Error extracting {os.path.basename(path_to_zip_file)}: {e}")
+                logger.error(f"Error extracting {zip_name}: {e}")
                 return None
 
             # Find and read all CSV files within the extracted structure
@@ -108,7 +127,7 @@ def process_zip_file(path_to_zip_file: str, doc_id: str, doc_type_code: str) ->
                          csv_file_paths.append(os.path.join(root, file))
 
             if not csv_file_paths:
-                logger.warning(f"No CSV files found in extracted zip: {os.path.basename(path_to_zip_file)}")
+                logger.warning(f"No CSV files found in extracted zip: {zip_name}")
                 return None
 
             for file_path in csv_file_paths:
@@ -125,21 +144,21 @@ def process_zip_file(path_to_zip_file: str, doc_id: str, doc_type_code: str) ->
                     })
 
             if not raw_csv_data:
-                 logger.warning(f"No valid data extracted from CSVs in {os.path.basename(path_to_zip_file)}")
+                 logger.warning(f"No valid data extracted from CSVs in {zip_name}")
                  return None
 
             # Dispatch raw data to appropriate document processor
             structured_data = process_raw_csv_data(raw_csv_data, doc_id, doc_type_code, temp_dir)
 
             if structured_data:
-                 logger.info(f"Successfully processed structured data for {os.path.basename(path_to_zip_file)}")
+                 logger.info(f"Successfully processed structured data for {zip_name}")
                  return structured_data
             else:
-                 logger.warning(f"Document processor returned no data for {os.path.basename(path_to_zip_file)}")
+                 logger.warning(f"Document processor returned no data for {zip_name}")
                  return None
 
     except Exception as e:
-        logger.error(f"Critical error processing zip file {path_to_zip_file}: {e}")
+        logger.error(f"Critical error processing zip file {zip_name}: {e}")
         # traceback.print_exc() # Uncomment for detailed traceback during debugging
         return None
 
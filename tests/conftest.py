@@ -194,3 +194,15 @@ def sample_xbrl_financial_metrics():
             }
         }
     }
+
+
+@pytest.fixture(autouse=True, scope='session')
+def isolated_disk_cache(tmp_path_factory):
+    """Keep parsed-CSV cache files out of the user's cache directory."""
+    original = os.environ.get('EDINET_TOOLS_CACHE_DIR')
+    os.environ['EDINET_TOOLS_CACHE_DIR'] = str(tmp_path_factory.mktemp('edinet_cache'))
+    yield
+    if original is None:
+        os.environ.pop('EDINET_TOOLS_CACHE_DIR', None)
+    else:
+        os.environ['EDINET_TOOLS_CACHE_DIR'] = original
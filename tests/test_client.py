@@ -239,9 +239,10 @@ class TestIntegration:
 class TestMockAPI:
     """Test with mocked API calls to avoid actual network requests."""
     
-    def setup_method(self):
-        """Set up test client."""
-        self.client = EdinetClient(api_key="test_key")
+    @pytest.fixture(autouse=True)
+    def setup_client(self, tmp_path):
+        """Set up test client that downloads into a temporary directory."""
+        self.client = EdinetClient(api_key="test_key", download_dir=str(tmp_path))
     
     @patch('edinet_tools.client.fetch_document')
     def test_download_filing_success(self, mock_fetch):
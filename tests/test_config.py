@@ -0,0 +1,185 @@
+"""
+Tests for edinet_tools.config — lazy .env loading and settings resolution.
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from edinet_tools import config
+
+
+@pytest.fixture
+def fresh_config():
+    """Reset config's lazily-resolved state, restoring it afterwards."""
+    saved = {name: config.__dict__.pop(name) for name in config._ENV_SETTINGS
+             if name in config.__dict__}
+    saved_loaded = config._env_loaded
+    config._env_loaded = False
+    yield config
+    for name in config._ENV_SETTINGS:
+        config.__dict__.pop(name, None)
+    config.__dict__.update(saved)
+    config._env_loaded = saved_loaded
+
+
+class TestLazyEnvLoading:
+    """Settings are resolved on first access, not at import."""
+
+    def test_env_not_loaded_until_access(self, fresh_config):
+        with patch.dict(os.environ), \
+                patch.object(fresh_config, '_load_env', wraps=fresh_config._load_env) as loader:
+            os.environ.pop('LLM_MODEL', None)
+            assert loader.call_count == 0
+            fresh_config.LLM_MODEL
+            assert loader.call_count == 1
+
+    def test_env_file_skipped_when_setting_already_set(self, fresh_config):
+        with patch.dict(os.environ, {'EDINET_API_KEY': 'env-key', 'LLM_API_KEY': 'llm-key'}), \
+                patch.object(fresh_config, '_load_env') as loader:
+            assert fresh_config.EDINET_API_KEY == 'env-key'
+            assert fresh_config.LLM_API_KEY == 'llm-key'
+            loader.assert_not_called()
+
+    def test_env_file_loaded_when_setting_missing(self, fresh_config):
+        with patch.dict(os.environ), patch.object(fresh_config, '_load_env') as loader:
+            os.environ.pop('AZURE_OPENAI_ENDPOINT', None)
+            fresh_config.AZURE_OPENAI_ENDPOINT
+            loader.assert_called_once()
+
+    def test_value_cached_after_first_access(self, fresh_config):
+        with patch.dict(os.environ, {'LLM_MODEL': 'first-model'}):
+            assert fresh_config.LLM_MODEL == 'first-model'
+        with patch.dict(os.environ, {'LLM_MODEL': 'second-model'}):
+            assert fresh_config.LLM_MODEL == 'first-model'
+
+    def test_missing_env_file_is_not_an_error(self, fresh_config, tmp_path, monkeypatch):
+        monkeypatch.setattr(fresh_config, 'dotenv_path', str(tmp_path / 'missing.env'))
+        monkeypatch.chdir(tmp_path)
+        fresh_config._load_env()
+        assert fresh_config._env_loaded
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            config.NOT_A_SETTING
+
+
+class TestSettingsResolution:
+    """Environment-backed settings resolve like the eager originals."""
+
+    def test_llm_api_key_fallback_chain(self, fresh_config):
+        env = {'GOOGLE_API_KEY': '', 'ANTHROPIC_API_KEY': 'anthropic-key'}
+        with patch.dict(os.environ, env):
+            os.environ.pop('LLM_API_KEY', None)
+            assert fresh_config.LLM_API_KEY == 'anthropic-key'
+
+    def test_llm_api_key_source_recorded(self, fresh_config):
+        env = {'LLM_API_KEY': '', 'GOOGLE_API_KEY': 'google-key'}
+        with patch.dict(os.environ, env):
+            assert fresh_config.LLM_API_KEY_SOURCE == 'GOOGLE_API_KEY'
+            assert fresh_config.LLM_API_KEY == 'google-key'
+
+    def test_llm_api_key_source_none_when_unset(self, fresh_config):
+        with patch.dict(os.environ):
+            for var in fresh_config._LLM_API_KEY_VARS:
+                os.environ.pop(var, None)
+            assert fresh_config.LLM_API_KEY is None
+            assert fresh_config.LLM_API_KEY_SOURCE is None
+
+    def test_llm_model_default(self, fresh_config):
+        with patch.dict(os.environ):
+            os.environ.pop('LLM_MODEL', None)
+            assert fresh_config.LLM_MODEL == 'claude-4-sonnet'
+
+    def test_missing_keys_do_not_log(self, fresh_config, caplog):
+        # Missing keys are reported where they are needed (_get_client), not here
+        with patch.dict(os.environ):
+            for var in ('EDINET_API_KEY',) + fresh_config._LLM_API_KEY_VARS:
+                os.environ.pop(var, None)
+            assert fresh_config.EDINET_API_KEY is None
+            assert fresh_config.LLM_API_KEY is None
+        assert caplog.records == []
+
+    def test_edinet_api_key_from_environment(self, fresh_config):
+        with patch.dict(os.environ, {'EDINET_API_KEY': 'env-key'}):
+            assert fresh_config.EDINET_API_KEY == 'env-key'
+
+
+class TestEnvFileLoading:
+    """.env values fill in what the environment leaves unset."""
+
+    def test_environment_takes_precedence(self, fresh_config, tmp_path, monkeypatch):
+        env_file = tmp_path / '.env'
+        env_file.write_text("EDINET_TEST_SETTING=from-file\n")
+        monkeypatch.setattr(fresh_config, 'dotenv_path', str(env_file))
+        monkeypatch.setenv('EDINET_TEST_SETTING', 'from-env')
+
+        fresh_config._load_env()
+        assert os.environ['EDINET_TEST_SETTING'] == 'from-env'
+
+
+class TestGetenv:
+    """Code that reads the environment directly still sees .env values."""
+
+    @pytest.fixture
+    def env_file(self, fresh_config, tmp_path, monkeypatch):
+        env_file = tmp_path / '.env'
+        env_file.write_text("EDINET_API_KEY=file-key\n")
+        monkeypatch.setattr(fresh_config, 'dotenv_path', str(env_file))
+        with patch.dict(os.environ):
+            os.environ.pop('EDINET_API_KEY', None)
+            yield env_file
+
+    def test_import_does_not_load_env_file(self, env_file):
+        # Importing the package leaves os.environ alone; getenv() is the way in
+        assert os.getenv('EDINET_API_KEY') is None
+        assert config.getenv('EDINET_API_KEY') == 'file-key'
+
+    def test_environment_changes_are_seen(self, env_file):
+        assert config.getenv('EDINET_API_KEY') == 'file-key'
+        os.environ['EDINET_API_KEY'] = 'new-key'
+        assert config.getenv('EDINET_API_KEY') == 'new-key'
+
+    def test_default_when_unset(self, fresh_config, tmp_path, monkeypatch):
+        monkeypatch.setattr(fresh_config, 'dotenv_path', str(tmp_path / 'missing.env'))
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('EDINET_TEST_SETTING', raising=False)
+        assert config.getenv('EDINET_TEST_SETTING', 'fallback') == 'fallback'
+
+    def test_module_client_uses_env_file_key(self, env_file):
+        from edinet_tools._client import _get_client, _reset_client
+        _reset_client()
+        try:
+            assert _get_client().api_key == 'file-key'
+        finally:
+            _reset_client()
+
+
+class TestEnvFileParsing:
+    """The built-in .env reader handles the common dotenv syntax."""
+
+    def test_parse_env_lines(self):
+        lines = [
+            "# comment",
+            "",
+            "PLAIN=value",
+            "export EXPORTED=yes",
+            'DOUBLE="quoted value"',
+            "SINGLE='it # stays'",
+            "TRAILING=value # comment",
+            "SPACED = padded ",
+            "EMPTY=",
+            "not a setting",
+        ]
+        assert config._parse_env_lines(lines) == {
+            'PLAIN': 'value',
+            'EXPORTED': 'yes',
+            'DOUBLE': 'quoted value',
+            'SINGLE': 'it # stays',
+            'TRAILING': 'value',
+            'SPACED': 'padded',
+            'EMPTY': '',
+        }
+
+    def test_value_may_contain_equals(self):
+        assert config._parse_env_lines(["KEY=a=b"]) == {'KEY': 'a=b'}
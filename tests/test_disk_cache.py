@@ -0,0 +1,74 @@
+"""Tests for the on-disk cache of parsed CSV indexes."""
+import os
+
+import pytest
+
+from edinet_tools import _disk_cache
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    """A source CSV and an empty cache directory."""
+    monkeypatch.setenv('EDINET_TOOLS_CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'Example_20260101.csv'
+    path.write_text('a,b\n1,2\n')
+    return str(path)
+
+
+class TestDiskCache:
+
+    def test_miss_when_nothing_stored(self, source):
+        assert _disk_cache.load(source, 'example-v1') is None
+
+    def test_round_trip(self, source):
+        _disk_cache.store(source, 'example-v1', {'a': [1, 2]})
+        assert _disk_cache.load(source, 'example-v1') == {'a': [1, 2]}
+
+    def test_names_are_independent(self, source):
+        _disk_cache.store(source, 'example-v1', 'one')
+        assert _disk_cache.load(source, 'example-v2') is None
+
+    def test_modified_source_invalidates(self, source):
+        _disk_cache.store(source, 'example-v1', 'stale')
+        with open(source, 'a') as f:
+            f.write('3,4\n')
+        assert _disk_cache.load(source, 'example-v1') is None
+
+    def test_corrupt_cache_file_is_a_miss(self, source):
+        _disk_cache.store(source, 'example-v1', 'value')
+        cache_dir = os.environ['EDINET_TOOLS_CACHE_DIR']
+        for name in os.listdir(cache_dir):
+            with open(os.path.join(cache_dir, name), 'wb') as f:
+                f.write(b'not a pickle')
+        assert _disk_cache.load(source, 'example-v1') is None
+
+    def test_empty_cache_dir_disables_cache(self, source, monkeypatch):
+        monkeypatch.setenv('EDINET_TOOLS_CACHE_DIR', '')
+        _disk_cache.store(source, 'example-v1', 'value')
+        assert _disk_cache.load(source, 'example-v1') is None
+
+    def test_unwritable_cache_dir_is_ignored(self, source, monkeypatch):
+        monkeypatch.setenv('EDINET_TOOLS_CACHE_DIR', source)  # a file, not a directory
+        _disk_cache.store(source, 'example-v1', 'value')
+        assert _disk_cache.load(source, 'example-v1') is None
+
+
+def test_fund_registry_cached_between_processes(tmp_path):
+    """A second process loads the fund registry from the cache, not the CSV."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, edinet_tools; from unittest.mock import patch; "
+        "m = sys.modules['edinet_tools.entity']; "
+        "p = patch.object(m, '_parse_funds', wraps=m._parse_funds); "
+        "parse = p.start(); f = edinet_tools.fund('G01003'); "
+        "print(parse.call_count, f.fund_code)"
+    )
+    env = dict(os.environ, EDINET_TOOLS_CACHE_DIR=str(tmp_path))
+    runs = [
+        subprocess.run([sys.executable, "-c", code], capture_output=True,
+                       text=True, check=True, env=env).stdout.split()
+        for _ in range(2)
+    ]
+    assert runs == [['1', 'G01003'], ['0', 'G01003']]
@@ -51,3 +51,26 @@ class TestDocType:
         dt = doc_type("130")
         assert dt is not None
         assert "Amendment" in dt.name_en or "訂正" in dt.name_jp
+
+    def test_list_doc_types_returns_fresh_list(self):
+        """Callers may mutate the returned list without affecting the registry."""
+        types = list_doc_types()
+        types.clear()
+        assert len(list_doc_types()) > 0
+
+    def test_registry_is_read_only(self):
+        """The underlying registry cannot be mutated."""
+        from edinet_tools.doc_types import _DOC_TYPES
+        with pytest.raises(TypeError):
+            _DOC_TYPES["999"] = DocType(code="999", name_en="Fake", name_jp="偽")
+
+    def test_list_doc_types_sorted_by_code(self):
+        """Doc types are listed in code order."""
+        codes = [t.code for t in list_doc_types()]
+        assert codes == sorted(codes)
+
+    def test_doc_type_is_immutable(self):
+        """DocType instances are frozen."""
+        dt = doc_type("350")
+        with pytest.raises(AttributeError):
+            dt.name_en = "Changed"
@@ -36,6 +36,25 @@ class TestDocumentBasics:
         assert doc.filing_datetime.month == 1
         assert doc.filing_datetime.day == 15
 
+    @pytest.mark.parametrize("submit_dt, expected", [
+        ('2026-01-15 09:30', datetime(2026, 1, 15, 9, 30)),
+        ('2026-01-15 09:30:45', datetime(2026, 1, 15, 9, 30, 45)),
+        ('2026-01-15', datetime(2026, 1, 15)),
+        ('2026-01-15T09:30+09:00', datetime(2026, 1, 15, 9, 30)),
+        ('2026-01-15T00:30+00:00', datetime(2026, 1, 15, 9, 30)),
+        ('not a date', None),
+        ('', None),
+    ])
+    def test_document_filing_datetime_formats(self, submit_dt, expected):
+        """Supported submitDateTime formats parse; anything else is None."""
+        doc = Document({'docID': 'S100ABC123', 'submitDateTime': submit_dt})
+        assert doc.filing_datetime == expected
+
+    def test_document_filing_datetime_parsed_once(self):
+        """Repeated accesses return the same cached datetime."""
+        doc = Document({'docID': 'S100ABC123', 'submitDateTime': '2026-01-15 09:30'})
+        assert doc.filing_datetime is doc.filing_datetime
+
     def test_document_doc_type_returns_doctype_object(self):
         """Document.doc_type returns DocType object."""
         from edinet_tools.doc_types import DocType
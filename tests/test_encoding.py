@@ -0,0 +1,41 @@
+"""
+Tests for edinet_tools._encoding (CSV encoding detection shared by the parsers).
+"""
+
+import codecs
+
+import pytest
+
+from edinet_tools._encoding import FALLBACK_ENCODINGS, candidate_encodings, sniff_encoding
+
+TEXT = "提出者名\tトヨタ自動車株式会社"
+
+
+class TestSniffEncoding:
+    """The likeliest encoding comes from the BOM, NUL bytes, or a trial decode."""
+
+    @pytest.mark.parametrize('sample, expected', [
+        (codecs.BOM_UTF8 + TEXT.encode('utf-8'), 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE + TEXT.encode('utf-16-le'), 'utf-16'),
+        (codecs.BOM_UTF16_BE + TEXT.encode('utf-16-be'), 'utf-16'),
+        (TEXT.encode('utf-16-le'), 'utf-16le'),
+        (TEXT.encode('utf-8'), 'utf-8'),
+        (TEXT.encode('euc-jp'), 'euc-jp'),
+        (TEXT.encode('cp932'), 'cp932'),
+        (b'plain ascii', 'utf-8'),
+    ])
+    def test_sniff(self, sample, expected):
+        assert sniff_encoding(sample) == expected
+
+    def test_character_cut_off_by_sample_end(self):
+        assert sniff_encoding(TEXT.encode('utf-8')[:-1]) == 'utf-8'
+
+
+class TestCandidateEncodings:
+    """Callers retry in one fixed order after the sniffed encoding."""
+
+    def test_sniffed_encoding_first(self):
+        assert candidate_encodings(TEXT.encode('cp932')) == ['cp932', 'utf-8', 'euc-jp']
+
+    def test_bom_encoding_then_fallbacks(self):
+        assert candidate_encodings(codecs.BOM_UTF16_LE) == ['utf-16', *FALLBACK_ENCODINGS]
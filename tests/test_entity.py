@@ -61,6 +61,13 @@ class TestEntityBasics:
         repr_str = repr(entity)
         assert 'E02144' in repr_str
 
+    def test_entity_has_no_instance_dict(self):
+        """Entity uses __slots__, so instances carry no per-instance __dict__."""
+        entity = Entity({'edinet_code': 'E02144'})
+        assert not hasattr(entity, '__dict__')
+        with pytest.raises(AttributeError):
+            entity.unexpected = 1
+
 
 class TestEntityLookup:
     """Test entity lookup functions using real CSV data."""
@@ -163,6 +170,23 @@ class TestFundLookup:
         assert result is not None
         assert result.fund_code == 'G01003'
 
+    def test_fund_lookups_return_independent_objects(self):
+        """Each lookup wraps the cached record in its own data dict."""
+        first, second = fund("G01003"), fund("G01003")
+        assert first._data == second._data
+        assert first._data is not second._data
+
+    def test_fund_by_name_is_case_insensitive(self):
+        """Name lookup matches a substring regardless of case."""
+        by_code = fund("G01003")
+        result = fund(by_code.name.swapcase())
+        assert result is not None
+        assert by_code.name.lower() in result.name.lower()
+
+    def test_fund_unknown_name_returns_none(self):
+        """Unknown fund names return None."""
+        assert fund("no such fund zzzz") is None
+
     def test_funds_by_issuer_returns_list(self):
         """funds_by_issuer returns a list."""
         # Use a known fund issuer from the data
@@ -553,11 +577,11 @@ def test_search_homonym_returns_multiple():
     query = None
     for code in codes:
         raw = c._edinet_entities[code]
-        if normalize_for_matching(raw.get('name_jp')) == normalized_name:
-            query = raw['name_jp']
+        if normalize_for_matching(raw.name_jp) == normalized_name:
+            query = raw.name_jp
             break
-        if normalize_for_matching(raw.get('name_en')) == normalized_name:
-            query = raw['name_en']
+        if normalize_for_matching(raw.name_en) == normalized_name:
+            query = raw.name_en
             break
     assert query is not None, "Could not reconstruct a query for the homonym set"
     results = edinet_tools.search_entities(query, limit=20)
@@ -566,3 +590,140 @@ def test_search_homonym_returns_multiple():
     assert len(intersection) >= 2, \
         f"Homonym query {query!r} (norm: {normalized_name!r}) returned {result_codes}, " \
         f"expected at least 2 of {codes}"
+
+
+def test_search_index_built_once_per_classifier():
+    """The substring-search index is reused across queries."""
+    from edinet_tools.entity import _get_classifier, _get_search_index
+    classifier = _get_classifier()
+    index = _get_search_index(classifier)
+    assert _get_search_index(classifier) is index
+    assert len(index) == len(classifier._edinet_entities)
+
+
+def test_entity_documents_keeps_newest_first_order():
+    """Concurrent day fetches still return filings newest day first."""
+    from edinet_tools.timezone import today_jst
+
+    today = today_jst()
+
+    def by_date(check_date):
+        offset = (today - check_date).days
+        return [{'docID': f'S{offset}', 'docTypeCode': '350', 'edinetCode': 'E02144'}]
+
+    mock_client = Mock()
+    mock_client.get_documents_by_date.side_effect = by_date
+
+    toyota = entity("7203")
+    toyota._client = mock_client
+    docs = toyota.documents(days=10)
+
+    assert [d.doc_id for d in docs] == [f'S{i}' for i in range(10)]
+
+
+def test_entity_documents_skips_failed_days():
+    """An API error on one day does not drop the other days' filings."""
+    from datetime import timedelta
+    from edinet_tools.timezone import today_jst
+
+    failing_day = today_jst() - timedelta(days=1)
+
+    def by_date(check_date):
+        if check_date == failing_day:
+            raise RuntimeError("network down")
+        return [{'docID': str(check_date), 'docTypeCode': '350', 'edinetCode': 'E02144'}]
+
+    mock_client = Mock()
+    mock_client.get_documents_by_date.side_effect = by_date
+
+    toyota = entity("7203")
+    toyota._client = mock_client
+    docs = toyota.documents(days=3)
+
+    assert len(docs) == 2
+    assert str(failing_day) not in [d.doc_id for d in docs]
+
+
+def test_entity_documents_shares_past_days_across_entities():
+    """Past daily indexes are fetched once per client, not once per entity."""
+    mock_client = Mock()
+    mock_client.get_documents_by_date.return_value = []
+
+    for code in ("7203", "6758"):
+        e = entity(code)
+        e._client = mock_client
+        e.documents(days=5)
+
+    # Today is refetched for each entity; the 4 past days only once
+    assert mock_client.get_documents_by_date.call_count == 2 + 4
+
+
+def test_entity_documents_past_days_not_shared_across_clients(monkeypatch):
+    """A new client (e.g. after configure()) refetches past days."""
+    from edinet_tools import _client
+    from edinet_tools._client import _get_client, configure
+
+    # Leave the module client state as other tests left it
+    monkeypatch.setattr(_client, '_client_entry', None)
+    monkeypatch.setattr(_client, '_configured_api_key', None)
+
+    calls = []
+    with patch('edinet_tools.client.EdinetClient.get_documents_by_date',
+               autospec=True, side_effect=lambda client, d: calls.append(client) or []):
+        configure(api_key="first-key")
+        entity("7203").documents(days=3)
+        configure(api_key="second-key")
+        entity("7203").documents(days=3)
+        second_client = _get_client()
+
+    assert len(calls) == 6
+    assert calls[-1] is second_client
+
+
+def test_entity_documents_cache_does_not_keep_client_alive():
+    """Past-day indexes are dropped along with their client."""
+    import gc
+    import weakref
+    from edinet_tools.entity import _past_documents
+
+    mock_client = Mock()
+    mock_client.get_documents_by_date.return_value = []
+    e = entity("7203")
+    e._client = mock_client
+    e.documents(days=3)
+    assert mock_client in _past_documents
+
+    client_ref = weakref.ref(mock_client)
+    del e, mock_client
+    gc.collect()
+    assert client_ref() is None
+
+
+def test_entity_documents_past_days_cache_is_bounded(monkeypatch):
+    """Only the most recently used past days are kept per client."""
+    import sys
+    from edinet_tools.entity import _past_documents
+
+    monkeypatch.setattr(sys.modules['edinet_tools.entity'], '_PAST_DOCUMENTS_MAX_DAYS', 2)
+    mock_client = Mock()
+    mock_client.get_documents_by_date.return_value = []
+    e = entity("7203")
+    e._client = mock_client
+    e.documents(days=5)
+
+    assert len(_past_documents[mock_client]) == 2
+
+
+def test_clear_documents_cache_refetches_past_days():
+    """clear_documents_cache() makes the next lookup refetch past days."""
+    from edinet_tools import clear_documents_cache
+
+    mock_client = Mock()
+    mock_client.get_documents_by_date.return_value = []
+    e = entity("7203")
+    e._client = mock_client
+    e.documents(days=3)
+    clear_documents_cache()
+    e.documents(days=3)
+
+    assert mock_client.get_documents_by_date.call_count == 6
@@ -100,6 +100,33 @@ class TestEntityClassifierLoading:
         assert len(classifier._edinet_entities) > 10000
         assert len(classifier._fund_edinet_codes) > 300
 
+    def test_finds_latest_bundled_csvs(self, classifier):
+        """Default paths point at the highest-dated CSV of each kind."""
+        import glob
+        import os
+
+        data_dir = os.path.dirname(classifier.edinet_codes_path)
+        for prefix, path in (('EdinetcodeDlInfo', classifier.edinet_codes_path),
+                             ('FundcodeDlInfo', classifier.fund_codes_path)):
+            assert path == max(glob.glob(os.path.join(data_dir, f'{prefix}*.csv')))
+        assert classifier._find_latest_file('NoSuchPrefix') is None
+
+    def test_fund_codes_are_immutable(self, classifier):
+        """The fund registry cannot be modified after load."""
+        assert isinstance(classifier._fund_edinet_codes, frozenset)
+
+    def test_fund_lookup_does_not_load_edinet_registry(self):
+        """is_fund() answers from the fund registry alone."""
+        from unittest.mock import patch
+
+        with patch.object(EntityClassifier, '_parse_edinet_codes') as parse_edinet, \
+                patch('edinet_tools._disk_cache.load', return_value=None):
+            c = EntityClassifier()
+            assert c.is_fund('E03041')
+            assert not c.is_fund('E99999')
+        parse_edinet.assert_not_called()
+        assert c.get_entity_type('E02144') == EntityType.LISTED_COMPANY
+
     def test_stats_returns_expected_structure(self, classifier):
         """Stats should return count information."""
         stats = classifier.stats
@@ -110,6 +137,12 @@ class TestEntityClassifierLoading:
         assert stats['total_entities'] > 10000
         assert stats['listed_companies'] > 3000
 
+    def test_stats_does_not_share_state(self, classifier):
+        """Each stats call returns a fresh dict with the same counts."""
+        first = classifier.stats
+        first['listed_companies'] = -1
+        assert classifier.stats['listed_companies'] > 0
+
     def test_data_version_extracted(self, classifier):
         """Data version should be extracted from filenames."""
         version = classifier.data_version
@@ -118,6 +151,23 @@ class TestEntityClassifierLoading:
         # Should be YYYY-MM-DD format or 'unknown'
         assert version['edinet_codes'] == 'unknown' or len(version['edinet_codes']) == 10
 
+    def test_second_load_uses_disk_cache(self, tmp_path, monkeypatch):
+        """A later classifier reuses the parsed indexes instead of the CSVs."""
+        from unittest.mock import patch
+
+        monkeypatch.setenv('EDINET_TOOLS_CACHE_DIR', str(tmp_path))
+        first = EntityClassifier()
+        first._edinet_entities  # the EDINET registry loads on first use
+        with patch.object(EntityClassifier, '_parse_edinet_codes') as parse_edinet, \
+                patch.object(EntityClassifier, '_parse_fund_codes') as parse_funds:
+            second = EntityClassifier()
+            second._edinet_entities
+        parse_edinet.assert_not_called()
+        parse_funds.assert_not_called()
+        assert second._edinet_entities == first._edinet_entities
+        assert second._fund_edinet_codes == first._fund_edinet_codes
+        assert second._by_securities_code == first._by_securities_code
+
 
 class TestListedCompanyClassification:
     """Test classification of listed companies."""
@@ -157,7 +207,7 @@ class TestFundClassification:
         # Find a fund issuer that is NOT also listed in the EDINET registry.
         for code in classifier._fund_edinet_codes:
             entity = classifier._edinet_entities.get(code)
-            if not entity or not entity['is_listed']:
+            if not entity or not entity.is_listed:
                 assert classifier.is_fund(code)
                 assert classifier.get_entity_type(code) == EntityType.FUND
                 return
@@ -208,6 +258,22 @@ class TestUnknownEntities:
         assert classifier.get_entity_type('ABCDE') == EntityType.UNKNOWN
 
 
+class TestBatchClassification:
+    """Test classifying many codes in one call."""
+
+    def test_matches_single_code_lookups(self, classifier):
+        """get_entity_types agrees with get_entity_type, in input order."""
+        codes = ['E02144', 'E03041', 'E99999', '', None, *list(classifier._entity_types)[:500]]
+        assert classifier.get_entity_types(codes) == [
+            classifier.get_entity_type(code) for code in codes
+        ]
+
+    def test_accepts_any_iterable(self, classifier):
+        """Generators work as well as lists."""
+        assert classifier.get_entity_types(c for c in ('E02144',)) == [EntityType.LISTED_COMPANY]
+        assert classifier.get_entity_types([]) == []
+
+
 class TestSecuritiesCodeFormatting:
     """Test securities code extraction and formatting."""
 
@@ -219,11 +285,19 @@ class TestSecuritiesCodeFormatting:
             assert len(code) == 4 or len(code) == 5  # Some may not have trailing 0
             assert code.isdigit()
 
+    def test_ticker_precomputed_from_securities_code(self, classifier):
+        """The stored ticker is the 5-digit code minus its trailing 0."""
+        for edinet_code, entity in classifier._edinet_entities.items():
+            code = entity.securities_code
+            expected = code[:4] if code and len(code) == 5 and code.endswith('0') else code
+            assert classifier.get_securities_code(edinet_code) == expected
+        assert classifier.get_securities_code('E02144') == '7203'
+
     def test_no_securities_code_for_unlisted(self, classifier):
         """Unlisted entities typically have no securities code."""
         # Find an unlisted entity
         for edinet_code, entity in classifier._edinet_entities.items():
-            if not entity['is_listed']:
+            if not entity.is_listed:
                 code = classifier.get_securities_code(edinet_code)
                 # Many unlisted entities have no code
                 # (this is expected behavior, not a test failure)
@@ -248,9 +322,9 @@ class TestEntityNames:
         """Japanese name should be returned when English not available."""
         # Find an entity without English name
         for edinet_code, entity in classifier._edinet_entities.items():
-            if entity['name_jp'] and not entity.get('name_en'):
+            if entity.name_jp and not entity.name_en:
                 name = classifier.get_entity_name(edinet_code, prefer_english=True)
-                assert name == entity['name_jp']
+                assert name == entity.name_jp
                 break
 
     def test_unknown_entity_name_is_none(self, classifier):
@@ -296,12 +370,27 @@ class TestReverseIndexes:
         assert classifier._by_corporate_number.get("5010001008846") == "E03533"
 
     def test_normalized_form_stored_per_entity(self, classifier):
-        """Each entity in _edinet_entities has a _normalized field used by the substring scan."""
+        """Each entity in _edinet_entities has a normalized field used by the substring scan."""
         raw = classifier._edinet_entities.get("E02144")  # Toyota
         assert raw is not None
-        assert '_normalized' in raw
-        assert isinstance(raw['_normalized'], str)
-        assert len(raw['_normalized']) > 0
+        assert isinstance(raw.normalized, str)
+        assert len(raw.normalized) > 0
+
+    def test_low_cardinality_values_share_objects(self, classifier):
+        """Equal submitter types / industries are stored as one str object."""
+        entities = classifier._edinet_entities.values()
+        for field in ('submitter_type', 'industry_jp'):
+            values = {getattr(e, field) for e in entities}
+            assert len({id(getattr(e, field)) for e in entities}) == len(values)
+
+    def test_entity_types_precomputed_for_every_known_code(self, classifier):
+        """Every registry and fund code has a precomputed type."""
+        assert set(classifier._entity_types) == (
+            set(classifier._edinet_entities) | classifier._fund_edinet_codes
+        )
+        assert EntityType.UNKNOWN not in classifier._entity_types.values()
+        for code in ('E02144', 'E03041'):
+            assert classifier._entity_types[code] == EntityType.LISTED_COMPANY
 
     def test_is_listed_handles_both_csv_languages(self, classifier):
         """FSA has used both 'Listed company' (English) and '上場' (Japanese)
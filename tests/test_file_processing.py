@@ -17,6 +17,7 @@ from edinet_tools.utils import (
     read_csv_file,
     clean_text, 
     process_zip_file,
+    process_zip_bytes,
     process_zip_directory
 )
 
@@ -186,6 +187,30 @@ auditor_opinion\tUnqualified'''
             assert 'main_data.csv' in filenames
             assert 'details.csv' in filenames
 
+    def test_zip_bytes_processed_without_file(self):
+        """ZIP content already in memory is processed the same as a file"""
+        import io
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            csv_content = '''要素ID\t項目名\t値
+jpdei_cor:EDINETCodeDEI\tEDINETコード\tE02144'''
+            zf.writestr('main_data.csv', csv_content.encode('utf-8'))
+
+        with patch('edinet_tools.utils.process_raw_csv_data') as mock_process:
+            mock_process.return_value = {'doc_id': 'S100BYTES', 'success': True}
+
+            result = process_zip_bytes(buf.getvalue(), 'S100BYTES', '160')
+
+            assert result == {'doc_id': 'S100BYTES', 'success': True}
+            raw_csv_data, doc_id, doc_type_code = mock_process.call_args[0][:3]
+            assert raw_csv_data[0]['filename'] == 'main_data.csv'
+            assert (doc_id, doc_type_code) == ('S100BYTES', '160')
+
+    def test_corrupted_zip_bytes_handling(self):
+        """Invalid in-memory ZIP content returns None"""
+        assert process_zip_bytes(b'This is not a ZIP file', 'S100BAD', '160') is None
+
     def test_corrupted_zip_file_handling(self):
         """Handle corrupted ZIP files gracefully"""
         bad_zip = os.path.join(self.temp_dir, 'corrupted.zip')
@@ -6,6 +6,8 @@ Detailed unit tests for Entity, Fund, etc. are in their respective test files.
 """
 
 import os
+from collections.abc import Mapping
+
 import pytest
 from unittest.mock import patch
 
@@ -29,7 +31,12 @@ class TestPackageExports:
         """Configuration functions are exported."""
         assert callable(edinet_tools.configure)
         assert callable(edinet_tools.documents)
-        assert isinstance(edinet_tools.DOCUMENT_TYPES, dict)
+        assert isinstance(edinet_tools.DOCUMENT_TYPES, Mapping)
+
+    def test_document_types_read_only(self):
+        """DOCUMENT_TYPES cannot be mutated by callers."""
+        with pytest.raises(TypeError):
+            edinet_tools.DOCUMENT_TYPES["999"] = "Not a real type"
 
     def test_entity_exports(self):
         """Entity API is exported."""
@@ -75,6 +82,36 @@ class TestPackageExports:
         for name in expected:
             assert name in edinet_tools.__all__, f"Missing: {name}"
 
+    def test_import_does_not_load_heavy_modules(self):
+        """Importing the package defers pandas, the legacy client, and parsers."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, edinet_tools; "
+            "print(any(m in sys.modules for m in "
+            "('pandas', 'edinet_tools.client', 'edinet_tools.parsers')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_lazy_exports_resolve(self):
+        """Every name in __all__ resolves to the object in its defining module."""
+        from edinet_tools.parsers import LargeHoldingReport
+
+        for name in edinet_tools.__all__:
+            assert getattr(edinet_tools, name) is not None, name
+        assert edinet_tools.LargeHoldingReport is LargeHoldingReport
+        assert callable(edinet_tools.entity)
+        assert callable(edinet_tools.doc_types)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError, not KeyError."""
+        with pytest.raises(AttributeError):
+            edinet_tools.not_a_real_export
+
 
 class TestModuleConfiguration:
     """Test module-level client configuration."""
@@ -93,6 +130,49 @@ class TestModuleConfiguration:
             client2 = _get_client()
             assert client1 is client2
 
+    def test_get_client_follows_env_var_changes(self):
+        """_get_client() returns a new client when EDINET_API_KEY changes."""
+        from edinet_tools._client import _get_client, _reset_client, configure
+
+        _reset_client()
+        configure(api_key=None)  # an explicit key from another test would win over the env
+        with patch.dict(os.environ, {'EDINET_API_KEY': 'key1'}):
+            client1 = _get_client()
+        with patch.dict(os.environ, {'EDINET_API_KEY': 'key2'}):
+            client2 = _get_client()
+        with patch.dict(os.environ, {'EDINET_API_KEY': 'key1'}):
+            client3 = _get_client()
+
+        assert client1 is not client2
+        assert client2.api_key == 'key2'
+        # Only the latest client is kept, so switching back builds a new one
+        assert client3 is not client1
+        assert client3.api_key == 'key1'
+        with patch.dict(os.environ, {'EDINET_API_KEY': 'key1'}):
+            assert _get_client() is client3
+
+    def test_get_client_does_not_warn(self):
+        """The module-level client is built without a deprecation warning."""
+        import warnings
+        from edinet_tools._client import _get_client, _reset_client
+
+        _reset_client()
+        with patch.dict(os.environ, {'EDINET_API_KEY': 'test-key'}):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                _get_client()
+
+    def test_get_client_without_api_key_raises(self):
+        """A missing API key is reported when a client is first needed."""
+        from edinet_tools._client import _get_client, _reset_client, configure
+
+        _reset_client()
+        configure(api_key=None)
+        with patch.dict(os.environ):
+            os.environ.pop('EDINET_API_KEY', None)
+            with pytest.raises(ConfigurationError):
+                _get_client()
+
     def test_configure_resets_client(self):
         """configure() resets the cached client."""
         from edinet_tools._client import configure, _get_client, _reset_client
@@ -123,6 +203,23 @@ class TestModuleConfiguration:
             assert isinstance(docs, list)
             assert len(docs) == 1
 
+    def test_documents_function_filters_by_doc_type(self):
+        """documents(doc_type=...) only returns filings of that type."""
+        from edinet_tools._client import _reset_client, configure
+
+        _reset_client()
+        with patch('edinet_tools._client.EdinetClient') as MockClient:
+            mock_instance = MockClient.return_value
+            mock_instance.get_documents_by_date.return_value = [
+                {'docID': 'S100AAAA', 'docTypeCode': '350'},
+                {'docID': 'S100BBBB', 'docTypeCode': '120'},
+                {'docID': 'S100CCCC', 'docTypeCode': '350'},
+            ]
+            configure(api_key='test-key')
+            docs = edinet_tools.documents('2026-01-15', doc_type='350')
+
+            assert [d.doc_id for d in docs] == ['S100AAAA', 'S100CCCC']
+
 
 class TestEndToEndWorkflows:
     """Test complete workflows using the public API."""
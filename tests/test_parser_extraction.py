@@ -651,3 +651,45 @@ class TestSemiAnnualExtraction:
         doc = make_mock_doc('S100FB', '160', rows)
         r = parse_semi_annual_report(doc)
         assert r.filing_date == date(2024, 9, 30)
+
+
+# =====================================================================
+# ZIP / CSV reading
+# =====================================================================
+
+class TestCsvExtraction:
+    """extract_csv_from_zip decoding and cell cleanup."""
+
+    def test_cells_are_cleaned(self):
+        from edinet_tools.parsers.extraction import extract_csv_from_zip
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w') as zf:
+            lines = [
+                '"jpdei_cor:EDINETCodeDEI"\t" label "\t"FilingDateInstant"\t0\t\t\t\t\t"E02144"',
+                '"jpdei_cor:EDINETCodeDEI"\t" label "\t"FilingDateInstant"\t0\t\t\t\t\t" \'E02\x00144\' "',
+            ]
+            zf.writestr('XBRL_TO_CSV/test.csv', '\n'.join(lines).encode('utf-16'))
+        [csv_file] = extract_csv_from_zip(zip_buffer.getvalue())
+        assert csv_file['filename'] == 'test.csv'
+        first, second = csv_file['data']
+        assert first == second
+        assert first['要素ID'] == 'jpdei_cor:EDINETCodeDEI'
+        assert first['項目名'] == 'label'
+        assert first['値'] == 'E02144'
+
+    @pytest.mark.parametrize('encoding', ['utf-16', 'utf-16le', 'utf-16-be-bom', 'utf-8', 'utf-8-sig',
+                                          'shift-jis', 'cp932', 'euc-jp'])
+    def test_decodes_any_encoding(self, encoding):
+        from edinet_tools.parsers.extraction import extract_csv_from_zip
+        content = 'jpdei_cor:FilerNameInJapaneseDEI\t提出者名\tFilingDateInstant\t0\t\t\t\t\tトヨタ自動車株式会社'
+        if encoding == 'utf-16-be-bom':
+            data = b'\xfe\xff' + content.encode('utf-16-be')
+        else:
+            data = content.encode(encoding)
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w') as zf:
+            zf.writestr('XBRL_TO_CSV/test.csv', data)
+        [csv_file] = extract_csv_from_zip(zip_buffer.getvalue())
+        [row] = csv_file['data']
+        assert row['要素ID'] == 'jpdei_cor:FilerNameInJapaneseDEI'
+        assert row['値'] == 'トヨタ自動車株式会社'
@@ -666,6 +666,26 @@ class TestExtractionUtilities:
         assert extract_value(csv_files, 'elem1', get_last=False) == 'first'
         assert extract_value(csv_files, 'elem1', get_last=True) == 'last'
 
+    def test_extract_value_from_element_index(self):
+        """extract_value gives the same answers from a build_element_index() index."""
+        from edinet_tools.parsers.extraction import build_element_index, extract_value
+        csv_files = [
+            {'filename': 'a.csv', 'data': [
+                {'要素ID': 'elem1', 'コンテキストID': 'ctx1', '値': 'first'},
+                {'要素ID': 'elem2', 'コンテキストID': 'ctx1', '値': 'other'},
+            ]},
+            {'filename': 'b.csv', 'data': [
+                {'要素ID': 'elem1', 'コンテキストID': 'ctx2', '値': 'last'},
+            ]},
+        ]
+        index = build_element_index(csv_files)
+        assert index['elem1'] == [('ctx1', 'first'), ('ctx2', 'last')]
+        for kwargs in ({}, {'get_last': True}, {'context_patterns': ['ctx2', 'ctx1']},
+                       {'context_patterns': ['missing']}):
+            for element_id in ('elem1', 'elem2', 'nonexistent'):
+                assert extract_value(index, element_id, **kwargs) == \
+                    extract_value(csv_files, element_id, **kwargs)
+
     def test_get_context_patterns_consolidated(self):
         """get_context_patterns: bare context = consolidated (EDINET convention)."""
         from edinet_tools.parsers.extraction import get_context_patterns
@@ -0,0 +1,236 @@
+"""
+Tests for edinet_tools.parser (XBRL_TO_CSV financial metric and text block extraction).
+"""
+
+import dataclasses
+import os
+import re
+
+import pytest
+from edinet_tools.parser import (
+    EdinetXbrlCsvParser,
+    FinancialMetric,
+    TextBlock,
+    extract_all,
+    extract_mtp_targets,
+    extract_xbrl_financial_data,
+)
+
+NET_SALES = EdinetXbrlCsvParser.FINANCIAL_METRICS['revenue_jgaap']
+BUSINESS_POLICY = EdinetXbrlCsvParser.NARRATIVE_TEXT_BLOCKS['business_policy']
+
+HEADER = ["要素ID", "項目名", "コンテキストID", "相対年度", "連結・個別",
+          "期間・時点", "ユニットID", "単位", "値"]
+
+POLICY_TEXT = (
+    "当社グループは中期経営計画において、2027年度に営業利益1,200億円を目標としています。"
+    "資本効率の向上にも取り組みます。"
+)
+
+
+def write_xbrl_csv(directory, rows, name='jpcrp.csv', encoding='utf-16'):
+    """Write rows the way EDINET's XBRL_TO_CSV files are laid out: tab-separated, quoted."""
+    csv_dir = directory / 'XBRL_TO_CSV'
+    csv_dir.mkdir(exist_ok=True)
+    lines = ['\t'.join(f'"{value}"' for value in row) for row in [HEADER, *rows]]
+    path = csv_dir / name
+    path.write_text('\n'.join(lines) + '\n', encoding=encoding)
+    return str(path)
+
+
+@pytest.fixture
+def sample_filing(tmp_path):
+    """An extracted filing with current/prior net sales, noise, and a policy text block."""
+    write_xbrl_csv(tmp_path, [
+        [NET_SALES, "売上高", "Prior1YearDuration", "前期", "連結", "期間", "JPY", "百万円", "900"],
+        [NET_SALES, "売上高", "CurrentYearDuration", "当期", "連結", "期間", "JPY", "百万円", "1,000"],
+        ["jpcrp_cor:SomethingElse", "その他", "CurrentYearDuration", "当期", "連結", "期間", "JPY", "円", "5"],
+        [BUSINESS_POLICY, "経営方針", "FilingDateInstant", "提出日時点", "その他", "時点", "", "", POLICY_TEXT],
+    ])
+    return str(tmp_path)
+
+
+class TestFinancialMetricPeriods:
+    """Test current/prior period classification."""
+
+    @pytest.mark.parametrize('context, period, current, prior', [
+        ('CurrentYearDuration', '当期', True, False),
+        ('Prior1YearDuration', '前期', False, True),
+        ('CurrentYearInstant', '', True, False),
+        ('Prior1YearInstant', '', False, True),
+        ('FilingDateInstant', 'CurrentYTDDuration', True, False),
+        ('FilingDateInstant', 'Prior1YTDDuration', False, True),
+        ('CurrentYearDuration', 'Duration', False, False),
+    ])
+    def test_classification(self, context, period, current, prior):
+        metric = FinancialMetric(NET_SALES, '売上高', context, period, '', 'JPY', '', 1.0)
+        assert metric.is_current_period is current
+        assert metric.is_prior_period is prior
+
+    def test_flags_do_not_affect_equality(self):
+        a = FinancialMetric(NET_SALES, '売上高', 'CurrentYearDuration', '', '', 'JPY', '', 1.0)
+        b = FinancialMetric(NET_SALES, '売上高', 'CurrentYearDuration', '', '', 'JPY', '', 1.0)
+        assert a.is_current_period
+        assert a == b
+
+    def test_metrics_have_no_instance_dict(self):
+        metric = FinancialMetric(NET_SALES, '売上高', 'CurrentYearDuration', '', '', 'JPY', '', 1.0)
+        assert not hasattr(metric, '__dict__')
+
+    def test_fields_cannot_go_stale(self):
+        metric = FinancialMetric(NET_SALES, '売上高', 'CurrentYearDuration', '', '', 'JPY', '', 1.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metric.context = 'Prior1YearDuration'
+        assert metric.is_current_period
+
+
+class TestFinancialMetrics:
+    """Test extraction of key financial metrics."""
+
+    def test_current_and_prior_values(self, sample_filing):
+        result = extract_xbrl_financial_data(sample_filing)
+        assert result['has_xbrl_data'] is True
+        assert result['financial_metrics'] == {
+            'revenue_jgaap': {
+                'current': 1_000_000_000.0,
+                'prior': 900_000_000.0,
+                'element_name': NET_SALES,
+            }
+        }
+
+    def test_only_relevant_elements_are_kept(self, sample_filing):
+        result = extract_xbrl_financial_data(sample_filing)
+        assert result['metrics_count'] == 2
+
+    @pytest.mark.parametrize('encoding', ['utf-16', 'utf-16-le', 'utf-8', 'utf-8-sig', 'shift-jis', 'cp932', 'euc-jp'])
+    def test_reads_any_encoding(self, tmp_path, encoding):
+        write_xbrl_csv(tmp_path, [
+            [NET_SALES, "売上高", "CurrentYearDuration", "当期", "連結", "期間", "JPY", "千円", "42"],
+        ], encoding=encoding)
+        result = extract_xbrl_financial_data(str(tmp_path))
+        assert result['financial_metrics']['revenue_jgaap']['current'] == 42_000.0
+
+    @pytest.mark.parametrize('encoding', ['shift-jis', 'cp932', 'euc-jp'])
+    def test_reads_japanese_text_after_ascii_start(self, tmp_path, encoding):
+        # No header and 8 KB of ASCII rows first, so the sampled bytes also decode as UTF-8
+        padding = [["jpcrp_cor:Padding", "x", "CurrentYearDuration", "", "", "", "", "", "0" * 64]] * 100
+        rows = [*padding, [BUSINESS_POLICY, "経営方針", "FilingDateInstant", "", "", "", "", "", POLICY_TEXT]]
+        path = tmp_path / 'jpcrp.csv'
+        path.write_text('\n'.join('\t'.join(row) for row in rows) + '\n', encoding=encoding)
+
+        result = EdinetXbrlCsvParser().parse_xbrl_csv_files([str(path)])
+        assert result['text_blocks']['business_policy']['content'] == POLICY_TEXT
+
+    @pytest.mark.parametrize('value, scale, expected', [
+        ('1,234', '円', 1234.0),
+        ('-1,234.5', '百万円', -1_234_500_000.0),
+        ('3', '十億円', 3_000_000_000.0),
+        ('12.5', '', 12.5),
+        ('－', '円', None),
+        ('nan', '円', None),
+        ('1e5', '円', None),
+        ('1_000', '円', None),
+        ('1-2', '円', None),
+    ])
+    def test_value_parsing(self, value, scale, expected):
+        row = [NET_SALES, '売上高', 'CurrentYearDuration', '当期', '連結', '期間', 'JPY', scale, value]
+        metric = EdinetXbrlCsvParser()._parse_csv_row(row)
+        assert metric.value == expected
+
+    def test_missing_directory(self, tmp_path):
+        assert extract_xbrl_financial_data(str(tmp_path)) == {'has_xbrl_data': False}
+
+    def test_only_csv_files_are_read(self, sample_filing):
+        csv_dir = os.path.join(sample_filing, 'XBRL_TO_CSV')
+        os.mkdir(os.path.join(csv_dir, 'nested.csv'))
+        with open(os.path.join(csv_dir, 'notes.txt'), 'w') as f:
+            f.write('not a csv')
+        result = extract_xbrl_financial_data(sample_filing)
+        assert result['metrics_count'] == 2
+
+
+class TestTextBlocks:
+    """Test narrative text block extraction and search."""
+
+    def test_known_block_uses_its_key(self, sample_filing):
+        result = extract_xbrl_financial_data(sample_filing)
+        block = result['text_blocks']['business_policy']
+        assert block['content'] == POLICY_TEXT
+        assert block['content_length'] == len(POLICY_TEXT)
+
+    def test_block_records_content_length(self):
+        block = TextBlock(BUSINESS_POLICY, '経営方針', POLICY_TEXT)
+        assert block.content_length == len(POLICY_TEXT)
+        assert block == TextBlock(BUSINESS_POLICY, '経営方針', POLICY_TEXT)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            block.text_content = ''
+
+    def test_other_blocks_use_local_element_name(self, tmp_path):
+        path = write_xbrl_csv(tmp_path, [
+            ["jpcrp_cor:OtherNotesTextBlock", "注記", "FilingDateInstant", "", "", "", "", "", "注記" * 30],
+        ])
+        parser = EdinetXbrlCsvParser()
+        result = parser.parse_xbrl_csv_files([path])
+        assert list(result['text_blocks']) == ['OtherNotesTextBlock']
+
+    @pytest.mark.parametrize('element_name, expected', [
+        (BUSINESS_POLICY, True),
+        ('jpcrp_cor:OtherNotesTextBlock', True),
+        ('jpcrp_cor:TextBlockHeading', False),
+        (NET_SALES, False),
+    ])
+    def test_is_text_block(self, element_name, expected):
+        assert EdinetXbrlCsvParser()._is_text_block(element_name) is expected
+
+    @pytest.mark.parametrize('line_break', ['\n', '\r\n'])
+    def test_multiline_block_keeps_line_breaks(self, tmp_path, line_break):
+        text = "第一段落です。" * 5 + line_break + "第二段落です。" * 5
+        path = write_xbrl_csv(tmp_path, [
+            [BUSINESS_POLICY, "経営方針", "FilingDateInstant", "", "", "", "", "", text],
+            [NET_SALES, "売上高", "CurrentYearDuration", "当期", "連結", "期間", "JPY", "円", "7"],
+        ])
+        parser = EdinetXbrlCsvParser()
+        result = parser.parse_xbrl_csv_files([path])
+        assert result['text_blocks']['business_policy']['content'] == text
+        assert result['financial_metrics']['revenue_jgaap']['current'] == 7.0
+
+    def test_search_text_blocks(self, sample_filing):
+        parser = EdinetXbrlCsvParser()
+        parser.parse_xbrl_csv_files([f"{sample_filing}/XBRL_TO_CSV/jpcrp.csv"])
+        matches = parser.search_text_blocks([r'資本効率'], context_chars=5)
+        assert matches == {'business_policy': [('資本効率', 'ています。資本効率の向上にも')]}
+
+    def test_search_accepts_compiled_patterns(self, sample_filing):
+        parser = EdinetXbrlCsvParser()
+        parser.parse_xbrl_csv_files([f"{sample_filing}/XBRL_TO_CSV/jpcrp.csv"])
+        compiled = parser.search_text_blocks([re.compile(r'資本効率')], context_chars=5)
+        assert compiled == parser.search_text_blocks([r'資本効率'], context_chars=5)
+
+
+class TestMtpTargets:
+    """Test Medium-Term Plan target extraction."""
+
+    def test_extracts_operating_profit_and_fiscal_year(self, sample_filing):
+        result = extract_mtp_targets(sample_filing)
+        assert result['has_mtp_data'] is True
+        assert result['targets']
+        target = result['targets'][0]
+        assert target['block'] == 'business_policy'
+        assert target['operating_profit_billions'] == [1200]
+        assert 'FY2027' in target['fiscal_years']
+
+    def test_reuses_preparsed_parser(self, sample_filing):
+        parser = EdinetXbrlCsvParser()
+        parser.parse_xbrl_csv_files([f"{sample_filing}/XBRL_TO_CSV/jpcrp.csv"])
+        assert extract_mtp_targets(sample_filing, parser=parser) == extract_mtp_targets(sample_filing)
+
+    def test_extract_all_combines_both(self, sample_filing):
+        result = extract_all(sample_filing)
+        mtp = result.pop('mtp_targets')
+        assert result == extract_xbrl_financial_data(sample_filing)
+        assert mtp == extract_mtp_targets(sample_filing)
+
+    def test_extract_all_without_xbrl_data(self, tmp_path):
+        result = extract_all(str(tmp_path))
+        assert result['has_xbrl_data'] is False
+        assert result['mtp_targets']['has_mtp_data'] is False